@@ -0,0 +1,159 @@
+"""Benchmark the puzzle solvers on synthetic inputs of increasing size.
+
+Usage:
+    python -m benchmarks.run [--scales 1 10 100] [--repeats 5] [--workload NAME]
+        [--output FILE]
+
+Without --workload, all workloads except the ones too slow for a routine run
+are benchmarked. Without --scales, every workload runs at its own scales.
+"""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.workloads import WORKLOADS, Workload
+
+DEFAULT_REPEATS = 5
+DEFAULT_OUTPUT = "benchmark_results.json"
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values using the nearest-rank method.
+
+    Args:
+        sorted_values (list[float]): The values, sorted ascending
+        fraction (float): The percentile as a fraction, like 0.95
+
+    Returns:
+        float: The value at the percentile
+    """
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def benchmark_workload(workload: Workload, scale: int, repeats: int) -> dict[str, Any]:
+    """Time a workload at a given scale.
+
+    The input is generated up front and the solver is called once to warm up
+    before the timed runs.
+
+    Args:
+        workload (Workload): The workload to benchmark
+        scale (int): The size of the input relative to the puzzle input
+        repeats (int): The number of timed runs
+
+    Returns:
+        dict[str, Any]: The timings in seconds
+    """
+    run = workload.prepare(scale)
+    run()
+
+    times: list[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    sorted_times = sorted(times)
+    return {
+        "workload": workload.name,
+        "day": workload.day,
+        "scale": scale,
+        "repeats": repeats,
+        "median": statistics.median(sorted_times),
+        "p95": percentile(sorted_times, 0.95),
+        "min": sorted_times[0],
+        "max": sorted_times[-1],
+        "times": times,
+    }
+
+
+def run_benchmarks(
+    workloads: list[Workload], scales: list[int] | None, repeats: int
+) -> dict[str, Any]:
+    """Benchmark all given workloads at all given scales.
+
+    Args:
+        workloads (list[Workload]): The workloads to benchmark
+        scales (list[int] | None): The input sizes relative to the puzzle input,
+            defaults to the scales of each workload
+        repeats (int): The number of timed runs per workload and scale
+
+    Returns:
+        dict[str, Any]: The environment and all results
+    """
+    results: list[dict[str, Any]] = []
+    for workload in workloads:
+        for scale in workload.scales if scales is None else scales:
+            result = benchmark_workload(workload, scale, repeats)
+            print(
+                f"{workload.name:<32} x{scale:<5} "
+                f"median {result['median'] * 1000:10.3f} ms "
+                f"p95 {result['p95'] * 1000:10.3f} ms",
+                file=sys.stderr,
+            )
+            results.append(result)
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """Main entry point for the benchmarks.
+
+    Args:
+        arguments (list[str] | None): The command line arguments, defaults to
+            sys.argv
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        help="input sizes relative to the puzzle input, defaults to the scales "
+        "of each workload",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=DEFAULT_REPEATS, help="timed runs per size"
+    )
+    parser.add_argument(
+        "--workload",
+        action="append",
+        choices=[workload.name for workload in WORKLOADS],
+        help="only run the given workload, can be repeated, defaults to all "
+        "workloads that run by default",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=Path(DEFAULT_OUTPUT), help="the JSON file"
+    )
+    parsed_arguments = parser.parse_args(arguments)
+
+    workloads = [
+        workload
+        for workload in WORKLOADS
+        if (
+            workload.run_by_default
+            if parsed_arguments.workload is None
+            else workload.name in parsed_arguments.workload
+        )
+    ]
+    report = run_benchmarks(
+        workloads, parsed_arguments.scales, parsed_arguments.repeats
+    )
+    parsed_arguments.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+from benchmarks.run import main, percentile, run_benchmarks
+from benchmarks.workloads import WORKLOADS, Workload
+
+
+def test_percentile() -> None:
+    """Test the nearest-rank percentile."""
+    values = [float(value) for value in range(1, 21)]
+    assert percentile(values, 0.95) == 19  # noqa: PLR2004
+    assert percentile(values, 0.5) == 10  # noqa: PLR2004
+    assert percentile([3.0], 0.95) == 3  # noqa: PLR2004
+
+
+def test_benchmark_results_are_saved_as_json(tmp_path: Path) -> None:
+    """Test running a single workload and saving the results."""
+    output_path = tmp_path / "results.json"
+    main(
+        [
+            "--workload",
+            "calculate_total_distance",
+            "--scales",
+            "1",
+            "2",
+            "--repeats",
+            "3",
+            "--output",
+            str(output_path),
+        ]
+    )
+
+    results = json.loads(output_path.read_text())["results"]
+    assert [result["scale"] for result in results] == [1, 2]
+    assert all(len(result["times"]) == 3 for result in results)  # noqa: PLR2004
+    assert all(result["median"] <= result["p95"] for result in results)
+
+
+def test_workloads_run_at_their_own_scales() -> None:
+    """Test that workloads run at their own scales unless scales are given."""
+    workload = Workload("identity", 0, lambda scale: lambda: scale, scales=(2, 3))
+    results = run_benchmarks([workload], None, 1)["results"]
+    assert [result["scale"] for result in results] == [2, 3]
+
+    results = run_benchmarks([workload], [1], 1)["results"]
+    assert [result["scale"] for result in results] == [1]
+
+
+def test_slow_workloads_only_run_when_selected() -> None:
+    """Test that the exponential forward search is left out by default."""
+    slow_workloads = [
+        workload.name for workload in WORKLOADS if not workload.run_by_default
+    ]
+    assert slow_workloads == ["get_sum_total_part2"]
@@ -0,0 +1,364 @@
+"""Synthetic puzzle inputs of a configurable size for benchmarking the solvers.
+
+Every workload generates an input that resembles the real puzzle input at scale
+1 and grows the amount of work linearly with the scale, so the results show how
+each solver scales. Inputs are generated from a fixed seed, so every run measures
+the same work.
+"""
+
+import math
+import random
+from collections.abc import Callable
+from typing import NamedTuple
+
+from utils.grid import create_grid_from_lines
+from year2024.day01.solution_2024_01 import calculate_total_distance
+from year2024.day02.solution_2024_02 import is_safe_report_with_dampening
+from year2024.day03.solution_2024_03 import find_all_instructions
+from year2024.day04.solution_2024_04 import count_number_of_occurrences
+from year2024.day05.solution_2024_05 import (
+    PageRules,
+    get_corrected_updates,
+    is_valid_update,
+)
+from year2024.day06.solution_2024_06 import (
+    find_exit_path,
+    find_exit_path_by_turns,
+    prevent_guard_from_moving_out,
+)
+from year2024.day07.solution_2024_07 import (
+    OPERATIONS_PART1,
+    OPERATIONS_PART2,
+    get_sum_total,
+)
+
+SEED = 2024
+
+
+DEFAULT_SCALES = (1, 10, 100)
+
+
+class Workload(NamedTuple):
+    """A solver together with a generator for its input.
+
+    Solvers that take too long at the larger scales only run at the scales they
+    list, and solvers that are too slow for any routine run are left out of the
+    default run, so they only run when selected by name.
+    """
+
+    name: str
+    day: int
+    prepare: Callable[[int], Callable[[], object]]
+    scales: tuple[int, ...] = DEFAULT_SCALES
+    run_by_default: bool = True
+
+
+def prepare_total_distance(scale: int) -> Callable[[], object]:
+    """Prepare day 1 with 1000 pairs of location ids per scale step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    left_list = [rng.randint(10_000, 99_999) for _ in range(1000 * scale)]
+    right_list = [rng.randint(10_000, 99_999) for _ in range(1000 * scale)]
+    return lambda: calculate_total_distance(left_list, right_list)
+
+
+def prepare_safe_reports_with_dampening(scale: int) -> Callable[[], object]:
+    """Prepare day 2 with 1000 mostly gradual reports per scale step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    reports: list[list[int]] = []
+    for _ in range(1000 * scale):
+        direction = rng.choice((-1, 1))
+        level = rng.randint(10, 90)
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            level += direction * rng.choice((0, 1, 2, 3, 4, -1))
+            report.append(level)
+        reports.append(report)
+
+    return lambda: sum(map(is_safe_report_with_dampening, reports))
+
+
+def prepare_find_all_instructions(scale: int) -> Callable[[], object]:
+    """Prepare day 3 with about 18 KB of corrupted memory per scale step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    fragments = ["do()", "don't()", "mul(", ")", ",", "what()", "[&}", "^", " ", "!"]
+    parts: list[str] = []
+    for _ in range(1200 * scale):
+        parts.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+        parts.extend(rng.choices(fragments, k=3))
+    memory = "".join(parts)
+    return lambda: find_all_instructions(memory)
+
+
+def prepare_count_number_of_occurrences(scale: int) -> Callable[[], object]:
+    """Prepare day 4 with a word search of 140 x 140 letters per scale step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    side = round(140 * math.sqrt(scale))
+    word_search = ["".join(rng.choices("XMAS", k=side)) for _ in range(side)]
+    return lambda: count_number_of_occurrences(word_search, "XMAS")
+
+
+def prepare_is_valid_update(scale: int) -> Callable[[], object]:
+    """Prepare day 5 with rules for all pairs of 49 pages and 200 updates per step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    pages = rng.sample(range(10, 100), 49)
+    before_rules = PageRules(
+        {page: pages[index + 1 :] for index, page in enumerate(pages)}
+    )
+
+    updates: list[list[int]] = []
+    for _ in range(200 * scale):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:  # noqa: PLR2004
+            update.sort(key=pages.index)
+        updates.append(update)
+
+    return lambda: sum(is_valid_update(update, before_rules) for update in updates)
+
+
+def prepare_get_corrected_updates(scale: int) -> Callable[[], object]:
+    """Prepare day 5 with rules for all pairs of 49 pages and 100 updates per step.
+
+    Every update is shuffled, so all of them need to be corrected.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    pages = rng.sample(range(10, 100), 49)
+    before_rules = PageRules(
+        {page: pages[index + 1 :] for index, page in enumerate(pages)}
+    )
+    updates = [rng.sample(pages, rng.randrange(5, 24, 2)) for _ in range(100 * scale)]
+    return lambda: get_corrected_updates(updates, before_rules)
+
+
+def generate_lab(scale: int) -> list[str]:
+    """Generate a day 6 lab of 130 x 130 cells per scale step.
+
+    The guard starts in the middle and is led outward along a square spiral with
+    two cells between the rings, so the path covers about half of the lab before
+    the guard leaves it, much like the winding path of the puzzle input. About
+    one in twenty of the other cells is an obstacle.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        list[str]: The lines describing the lab
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    side = round(130 * math.sqrt(scale))
+    rows = [["." for _ in range(side)] for _ in range(side)]
+
+    column, row = side // 2, side // 2
+    rows[row][column] = "^"
+    path = {(column, row)}
+    spiral_obstacles: set[tuple[int, int]] = set()
+
+    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    leg_length = 2
+    for leg in range(4 * side):
+        delta_column, delta_row = directions[leg % 4]
+        for _ in range(leg_length):
+            column, row = column + delta_column, row + delta_row
+            path.add((column, row))
+
+        obstacle = column + delta_column, row + delta_row
+        if not (0 <= obstacle[0] < side and 0 <= obstacle[1] < side):
+            break
+        spiral_obstacles.add(obstacle)
+        if leg % 2 == 1:
+            leg_length += 2
+
+    for column in range(side):
+        for row in range(side):
+            if (column, row) in spiral_obstacles or (
+                (column, row) not in path and rng.random() < 0.05  # noqa: PLR2004
+            ):
+                rows[row][column] = "#"
+
+    return ["".join(row) for row in rows]
+
+
+def prepare_find_exit_path(scale: int) -> Callable[[], object]:
+    """Prepare day 6 with a lab of 130 x 130 cells per scale step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    lab_grid = create_grid_from_lines(generate_lab(scale))
+    return lambda: find_exit_path(lab_grid)
+
+
+def prepare_find_exit_path_by_turns(scale: int) -> Callable[[], object]:
+    """Prepare day 6 with a lab of 130 x 130 cells per scale step, turn by turn.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    lab_grid = create_grid_from_lines(generate_lab(scale))
+    return lambda: find_exit_path_by_turns(lab_grid)
+
+
+def prepare_prevent_guard_from_moving_out(scale: int) -> Callable[[], object]:
+    """Prepare day 6 part 2 with a lab of 130 x 130 cells per scale step.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    lab_grid = create_grid_from_lines(generate_lab(scale))
+    return lambda: prevent_guard_from_moving_out(lab_grid)
+
+
+def generate_equations(scale: int) -> list[tuple[int, list[int]]]:
+    """Generate 850 day 7 equations per scale step.
+
+    Every equation has 2 to 12 numbers and about half of them can be made valid.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        list[tuple[int, list[int]]]: The totals and their numbers
+    """
+    rng = random.Random(SEED)  # noqa: S311
+    totals_and_numbers: list[tuple[int, list[int]]] = []
+    for _ in range(850 * scale):
+        numbers = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        total = numbers[0]
+        for number in numbers[1:]:
+            total = rng.choice(OPERATIONS_PART2)(total, number)
+        if rng.random() < 0.5:  # noqa: PLR2004
+            total += rng.randint(1, 9)
+        totals_and_numbers.append((total, numbers))
+
+    return totals_and_numbers
+
+
+def prepare_sum_total_part1(scale: int) -> Callable[[], object]:
+    """Prepare day 7 with the part 1 operations.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    totals_and_numbers = generate_equations(scale)
+    return lambda: get_sum_total(totals_and_numbers, OPERATIONS_PART1)
+
+
+def prepare_sum_total_part2(scale: int) -> Callable[[], object]:
+    """Prepare day 7 with the part 2 operations.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    totals_and_numbers = generate_equations(scale)
+    return lambda: get_sum_total(totals_and_numbers, OPERATIONS_PART2)
+
+
+def prepare_sum_total_backward_part1(scale: int) -> Callable[[], object]:
+    """Prepare day 7 with the part 1 operations, working back from the totals.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    totals_and_numbers = generate_equations(scale)
+    return lambda: get_sum_total(totals_and_numbers, OPERATIONS_PART1, backward=True)
+
+
+def prepare_sum_total_backward_part2(scale: int) -> Callable[[], object]:
+    """Prepare day 7 with the part 2 operations, working back from the totals.
+
+    Args:
+        scale (int): The size of the input relative to the puzzle input
+
+    Returns:
+        Callable[[], object]: The call to benchmark
+    """
+    totals_and_numbers = generate_equations(scale)
+    return lambda: get_sum_total(totals_and_numbers, OPERATIONS_PART2, backward=True)
+
+
+WORKLOADS: list[Workload] = [
+    Workload("calculate_total_distance", 1, prepare_total_distance),
+    Workload("is_safe_report_with_dampening", 2, prepare_safe_reports_with_dampening),
+    Workload("find_all_instructions", 3, prepare_find_all_instructions),
+    Workload("count_number_of_occurrences", 4, prepare_count_number_of_occurrences),
+    Workload("is_valid_update", 5, prepare_is_valid_update),
+    Workload("get_corrected_updates", 5, prepare_get_corrected_updates),
+    Workload("find_exit_path", 6, prepare_find_exit_path),
+    Workload("find_exit_path_by_turns", 6, prepare_find_exit_path_by_turns),
+    # Both the path and the walk from every candidate on it grow with the lab
+    Workload(
+        "prevent_guard_from_moving_out",
+        6,
+        prepare_prevent_guard_from_moving_out,
+        scales=(1, 10),
+    ),
+    # The forward search grows exponentially with the length of the equations
+    Workload("get_sum_total_part1", 7, prepare_sum_total_part1, scales=(1, 10)),
+    Workload(
+        "get_sum_total_part2",
+        7,
+        prepare_sum_total_part2,
+        scales=(1,),
+        run_by_default=False,
+    ),
+    Workload("get_sum_total_backward_part1", 7, prepare_sum_total_backward_part1),
+    Workload("get_sum_total_backward_part2", 7, prepare_sum_total_backward_part2),
+]
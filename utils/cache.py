@@ -0,0 +1,175 @@
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+CACHE_DIRECTORY_VARIABLE = "AOC_CACHE_DIR"
+DISABLE_CACHE_VARIABLE = "AOC_NO_CACHE"
+MAX_CACHE_SIZE_VARIABLE = "AOC_CACHE_MAX_BYTES"
+
+DEFAULT_MAX_CACHE_SIZE = 256 * 1024 * 1024
+
+CACHE_FILE_SUFFIX = ".pickle"
+
+# Returned by load_from_cache when there is no usable entry, as None is a valid
+# parsed result
+CACHE_MISS = object()
+
+
+def get_cache_directory() -> Path:
+    """Get the directory where parsed inputs are cached.
+
+    This is AOC_CACHE_DIR when set, otherwise advent-of-code in the user cache
+    directory.
+
+    Returns:
+        Path: The cache directory
+    """
+    if cache_directory := os.environ.get(CACHE_DIRECTORY_VARIABLE):
+        return Path(cache_directory)
+
+    user_cache_directory = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(user_cache_directory) / "advent-of-code"
+
+
+def get_max_cache_size() -> int:
+    """Get the maximum total size of all cached inputs.
+
+    This is AOC_CACHE_MAX_BYTES when set, otherwise DEFAULT_MAX_CACHE_SIZE.
+
+    Returns:
+        int: The maximum size in bytes
+    """
+    return int(os.environ.get(MAX_CACHE_SIZE_VARIABLE, DEFAULT_MAX_CACHE_SIZE))
+
+
+def cached_parser[T](
+    version: int,
+) -> Callable[[Callable[[str], T]], Callable[[str], T]]:
+    """Cache the result of an input parser on disk.
+
+    The parsed result is pickled into the cache directory, keyed on the content
+    hash of the input file, the parser and its version. Runs on an unchanged input
+    file load the pickle instead of parsing the text again. Bump the version
+    whenever the parser output changes, so stale results are never used. Caching
+    is skipped entirely when AOC_NO_CACHE is set.
+
+    Args:
+        version (int): The version of the parser output
+
+    Returns:
+        Callable[[Callable[[str], T]], Callable[[str], T]]: The decorator
+    """
+
+    def decorator(parser: Callable[[str], T]) -> Callable[[str], T]:
+        parser_name = f"{parser.__module__}.{parser.__qualname__}"
+
+        @functools.wraps(parser)
+        def cached(file_path: str) -> T:
+            if os.environ.get(DISABLE_CACHE_VARIABLE):
+                return parser(file_path)
+
+            cache_file = get_cache_directory() / get_cache_key(
+                file_path, parser_name, version
+            )
+
+            cached_result = load_from_cache(cache_file)
+            if cached_result is not CACHE_MISS:
+                # Mark the entry as recently used for the eviction order, which is
+                # best effort as well, for example in a read-only cache directory
+                with contextlib.suppress(OSError):
+                    cache_file.touch()
+                return cast("T", cached_result)
+
+            result = parser(file_path)
+            # Caching is best effort, the parsed result is valid either way
+            with contextlib.suppress(OSError):
+                store_in_cache(cache_file, result)
+
+            return result
+
+        return cached
+
+    return decorator
+
+
+def get_cache_key(file_path: str, parser_name: str, version: int) -> str:
+    """Get the cache file name for parsing a file with a given parser.
+
+    Args:
+        file_path (str): The input file
+        parser_name (str): The fully qualified name of the parser
+        version (int): The version of the parser output
+
+    Returns:
+        str: The cache file name
+    """
+    with Path(file_path).open("rb") as file:
+        content_hash = hashlib.file_digest(file, "sha256").hexdigest()
+
+    key = hashlib.sha256(f"{content_hash}:{parser_name}:{version}".encode())
+    return f"{key.hexdigest()}{CACHE_FILE_SUFFIX}"
+
+
+def load_from_cache(cache_file: Path) -> object:
+    """Load a parsed result from the cache.
+
+    Any failure counts as a cache miss. Next to missing or unreadable files,
+    unpickling corrupt or stale entries can raise almost anything, like an
+    AttributeError for a class that no longer exists.
+
+    Args:
+        cache_file (Path): The cache file to load the result from
+
+    Returns:
+        object: The parsed result, or CACHE_MISS if there is no usable entry
+    """
+    try:
+        return pickle.loads(cache_file.read_bytes())  # noqa: S301
+    except Exception:  # noqa: BLE001
+        return CACHE_MISS
+
+
+def store_in_cache(cache_file: Path, result: object) -> None:
+    """Store a parsed result in the cache and evict old entries when needed.
+
+    Args:
+        cache_file (Path): The cache file to store the result in
+        result (object): The parsed result
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so concurrent runs never see partial data
+    temporary_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    temporary_file.write_bytes(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+    temporary_file.replace(cache_file)
+
+    evict_from_cache(cache_file.parent, get_max_cache_size())
+
+
+def evict_from_cache(cache_directory: Path, max_size: int) -> None:
+    """Remove the least recently used cache entries until the size limit is met.
+
+    Args:
+        cache_directory (Path): The cache directory
+        max_size (int): The maximum total size of all entries in bytes
+    """
+    entries: list[tuple[float, int, Path]] = []
+    for cache_file in cache_directory.glob(f"*{CACHE_FILE_SUFFIX}"):
+        try:
+            stat = cache_file.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, cache_file in sorted(entries):
+        if total_size <= max_size:
+            break
+
+        cache_file.unlink(missing_ok=True)
+        total_size -= size
@@ -1,6 +1,106 @@
+from collections.abc import Iterator
+from itertools import batched
 from pathlib import Path
 
 
+def iterate_lines_from_file(file_path: str) -> Iterator[str]:
+    """Lazily read all lines from a given file.
+
+    Only a single line is held in memory at a time, so files larger than the
+    available memory can be processed. All lines will be stripped from trailing
+    whitespace.
+
+    Args:
+        file_path (str): The file to read the lines from
+
+    Yields:
+        str: The next line from the file
+    """
+    with Path(file_path).open() as file:
+        for line in file:
+            yield line.rstrip()
+
+
+def iterate_byte_lines_from_file(file_path: str) -> Iterator[bytes]:
+    """Lazily read all lines from a given file without decoding them.
+
+    This skips decoding entirely, which is faster for ASCII input that is parsed
+    further anyway, as int() accepts bytes as well. All lines will be stripped
+    from trailing whitespace.
+
+    Args:
+        file_path (str): The file to read the lines from
+
+    Yields:
+        bytes: The next line from the file
+    """
+    with Path(file_path).open("rb") as file:
+        for line in file:
+            yield line.rstrip()
+
+
+def read_lines_in_chunks(file_path: str, chunk_size: int) -> Iterator[list[str]]:
+    """Lazily read all lines from a given file in chunks of lines.
+
+    All lines will be stripped from trailing whitespace.
+
+    Args:
+        file_path (str): The file to read the lines from
+        chunk_size (int): The maximum number of lines per chunk
+
+    Yields:
+        list[str]: The next chunk of lines, only the last one can be shorter
+
+    Raises:
+        ValueError: If the chunk size is not positive
+    """
+    if chunk_size < 1:
+        msg = f"Chunk size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+
+    for chunk in batched(iterate_lines_from_file(file_path), chunk_size, strict=False):
+        yield list(chunk)
+
+
+def read_byte_chunks_from_file(file_path: str, chunk_size: int) -> Iterator[bytes]:
+    """Lazily read a given file in chunks of whole lines without decoding them.
+
+    Every chunk ends with a line break, so no line is ever split across chunks.
+    The part of a line that does not fit in a read is carried over to the next
+    chunk, so chunks stay below twice the chunk size unless a single line is
+    longer. The last chunk does not end with a line break if the file does not.
+
+    Args:
+        file_path (str): The file to read the chunks from
+        chunk_size (int): The number of bytes to read at a time
+
+    Yields:
+        bytes: The next chunk of lines from the file
+
+    Raises:
+        ValueError: If the chunk size is not positive
+    """
+    if chunk_size < 1:
+        msg = f"Chunk size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+
+    remainder = b""
+    with Path(file_path).open("rb") as file:
+        while data := file.read(chunk_size):
+            chunk = remainder + data
+            chunk_end = chunk.rfind(b"\n") + 1
+            if chunk_end == 0:
+                # A line longer than the chunk size, keep reading until it ends
+                remainder = chunk
+                continue
+
+            yield chunk[:chunk_end]
+            remainder = chunk[chunk_end:]
+
+    if remainder:
+        yield remainder
+
+
 def read_all_lines_from_file(file_path: str) -> list[str]:
     """Read al lines from a given file.
 
@@ -12,5 +112,4 @@ def read_all_lines_from_file(file_path: str) -> list[str]:
     Returns:
         list[str]: The lines from the file
     """
-    with Path(file_path).open() as file:
-        return [line.rstrip() for line in file]
+    return list(iterate_lines_from_file(file_path))
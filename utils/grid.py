@@ -1,5 +1,725 @@
+import mmap
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
 Point = tuple[int, int]
-Grid = dict[Point, str]
+
+# The generations of a StateTracker are stored in single bytes
+_MAX_GENERATION = 255
+
+NEIGHBOUR_DELTAS_4: tuple[Point, ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+NEIGHBOUR_DELTAS_8: tuple[Point, ...] = (
+    *NEIGHBOUR_DELTAS_4,
+    (1, -1),
+    (1, 1),
+    (-1, 1),
+    (-1, -1),
+)
+
+
+class DenseGrid:
+    """A rectangular grid of single character cells backed by a flat buffer.
+
+    The cells are stored row-major, one byte per cell, so a grid only costs
+    width * height bytes instead of a dictionary entry, a tuple key and a string
+    per cell. Points are given as (column, row), just like the dictionary based
+    grid this replaces.
+
+    Rows start every stride bytes in the buffer, which allows the grid to be a
+    view over the raw bytes of an input file where every row is followed by a line
+    break.
+
+    Next to the cells the grid keeps an index from a value to the sorted positions
+    holding it. The index for a value is built the first time that value is
+    looked up and is kept up to date when cells are set, so repeated lookups never
+    need a scan.
+    """
+
+    __slots__ = ("_cells", "_positions", "height", "stride", "width")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: bytearray | mmap.mmap,
+        stride: int | None = None,
+    ) -> None:
+        """Create a grid from row-major cell data.
+
+        Args:
+            width (int): The number of columns in the grid
+            height (int): The number of rows in the grid
+            cells (bytearray | mmap.mmap): The cell values, one byte per cell, row-major
+            stride (int | None): The distance between the starts of two rows in
+                the cell data, defaults to the width
+
+        Raises:
+            ValueError: If the cell data does not match the given dimensions
+        """
+        if stride is None:
+            stride = width
+
+        expected_length = (height - 1) * stride + width if height > 0 else 0
+        if stride < width or len(cells) < expected_length:
+            msg = f"Expected {expected_length} cells, got {len(cells)}"
+            raise ValueError(msg)
+
+        self.width = width
+        self.height = height
+        self.stride = stride
+        self._cells = cells
+        self._positions: dict[int, list[int]] = {}
+
+    def __contains__(self, point: object) -> bool:
+        """Check if a point lies within the grid.
+
+        Args:
+            point (object): The point to check
+
+        Returns:
+            bool: True if the point is inside the grid
+        """
+        if not isinstance(point, tuple) or len(point) != 2:  # noqa: PLR2004
+            return False
+
+        column, row = point
+        return 0 <= column < self.width and 0 <= row < self.height
+
+    def __getitem__(self, point: Point) -> str:
+        """Get the value for a point in the grid.
+
+        Args:
+            point (Point): The point to get the value for
+
+        Returns:
+            str: The value at the given point
+
+        Raises:
+            KeyError: If the point lies outside the grid
+        """
+        return chr(self._cells[self._index(point)])
+
+    def __setitem__(self, point: Point, value: str) -> None:
+        """Set the value for a point in the grid.
+
+        Args:
+            point (Point): The point to set the value for
+            value (str): The single character value to set
+
+        Raises:
+            KeyError: If the point lies outside the grid
+        """
+        index = self._index(point)
+        old_value = self._cells[index]
+        new_value = ord(value)
+        if old_value == new_value:
+            return
+
+        self._cells[index] = new_value
+
+        if old_value in self._positions:
+            old_positions = self._positions[old_value]
+            del old_positions[bisect_left(old_positions, index)]
+
+        if new_value in self._positions:
+            insort(self._positions[new_value], index)
+
+    def __len__(self) -> int:
+        """Get the number of cells in the grid.
+
+        Returns:
+            int: The number of cells
+        """
+        return self.width * self.height
+
+    def __iter__(self) -> Iterator[Point]:
+        """Iterate over all points in the grid, row by row.
+
+        Yields:
+            Point: The next point in the grid
+        """
+        for row in range(self.height):
+            for column in range(self.width):
+                yield column, row
+
+    def items(self) -> Iterator[tuple[Point, str]]:
+        """Iterate over all points and their values, row by row.
+
+        Yields:
+            tuple[Point, str]: The next point and its value
+        """
+        cells = self._cells
+        for row in range(self.height):
+            row_start = row * self.stride
+            for column in range(self.width):
+                yield (column, row), chr(cells[row_start + column])
+
+    def points_for_value(self, value: str) -> list[Point]:
+        """Get all points holding a given value, row by row.
+
+        Args:
+            value (str): The value to look for
+
+        Returns:
+            list[Point]: The points with the value, empty when there are none
+        """
+        stride = self.stride
+        return [
+            (index % stride, index // stride) for index in self._get_positions(value)
+        ]
+
+    def first_point_for_value(self, value: str) -> Point | None:
+        """Get the first point holding a given value, row by row.
+
+        Args:
+            value (str): The value to look for
+
+        Returns:
+            Point | None: The first point with the value or None when not found
+        """
+        byte_value = ord(value)
+        if byte_value in self._positions:
+            positions = self._positions[byte_value]
+            index = positions[0] if positions else -1
+        else:
+            index = self._find(byte_value, 0)
+
+        if index < 0:
+            return None
+
+        row, column = divmod(index, self.stride)
+        return column, row
+
+    def _get_positions(self, value: str) -> list[int]:
+        byte_value = ord(value)
+        if byte_value not in self._positions:
+            positions: list[int] = []
+            index = self._find(byte_value, 0)
+            while index >= 0:
+                positions.append(index)
+                index = self._find(byte_value, index + 1)
+            self._positions[byte_value] = positions
+
+        return self._positions[byte_value]
+
+    def _find(self, byte_value: int, start: int) -> int:
+        # Finding is done on the raw buffer, so skip any hits in the bytes between
+        # the end of a row and the start of the next one.
+        cells = self._cells
+        end = (self.height - 1) * self.stride + self.width if self.height > 0 else 0
+        index = cells.find(bytes((byte_value,)), start, end)
+        while index >= 0 and index % self.stride >= self.width:
+            index = cells.find(bytes((byte_value,)), index + 1, end)
+
+        return index
+
+    def _index(self, point: Point) -> int:
+        column, row = point
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            raise KeyError(point)
+
+        return row * self.stride + column
+
+
+Grid = DenseGrid
+
+
+class ArrayGrid:
+    """A rectangular grid of single character cells backed by a NumPy array.
+
+    The cells are held in a 2-D uint8 array indexed as [row, column], surrounded by
+    a border of zero bytes. The border allows neighbour lookups to be returned as
+    shifted views of the same memory, so whole-grid checks can be written as array
+    operations instead of loops over all cells. Points are given as (column, row),
+    just like for a DenseGrid.
+
+    This grid requires NumPy, use create_array_grid_from_lines to fall back to a
+    DenseGrid when it is not installed.
+    """
+
+    __slots__ = ("_padded", "cells", "height", "width")
+
+    def __init__(self, cells: "npt.NDArray[np.uint8]") -> None:
+        """Create a grid from a 2-D array of cell values.
+
+        Args:
+            cells (npt.NDArray[np.uint8]): The cell values indexed as [row, column]
+
+        Raises:
+            ModuleNotFoundError: If NumPy is not installed
+        """
+        if np is None:
+            msg = "ArrayGrid requires numpy to be installed"
+            raise ModuleNotFoundError(msg)
+
+        self.height, self.width = cells.shape
+        self._padded = np.zeros((self.height + 2, self.width + 2), dtype=np.uint8)
+        self._padded[1:-1, 1:-1] = cells
+        self.cells = self._padded[1:-1, 1:-1]
+
+    def __contains__(self, point: object) -> bool:
+        """Check if a point lies within the grid.
+
+        Args:
+            point (object): The point to check
+
+        Returns:
+            bool: True if the point is inside the grid
+        """
+        if not isinstance(point, tuple) or len(point) != 2:  # noqa: PLR2004
+            return False
+
+        column, row = point
+        return 0 <= column < self.width and 0 <= row < self.height
+
+    def __getitem__(self, point: Point) -> str:
+        """Get the value for a point in the grid.
+
+        Args:
+            point (Point): The point to get the value for
+
+        Returns:
+            str: The value at the given point
+
+        Raises:
+            KeyError: If the point lies outside the grid
+        """
+        if point not in self:
+            raise KeyError(point)
+
+        column, row = point
+        return chr(self.cells[row, column])
+
+    def __setitem__(self, point: Point, value: str) -> None:
+        """Set the value for a point in the grid.
+
+        Args:
+            point (Point): The point to set the value for
+            value (str): The single character value to set
+
+        Raises:
+            KeyError: If the point lies outside the grid
+        """
+        if point not in self:
+            raise KeyError(point)
+
+        column, row = point
+        self.cells[row, column] = ord(value)
+
+    def __len__(self) -> int:
+        """Get the number of cells in the grid.
+
+        Returns:
+            int: The number of cells
+        """
+        return self.width * self.height
+
+    def items(self) -> Iterator[tuple[Point, str]]:
+        """Iterate over all points and their values, row by row.
+
+        Yields:
+            tuple[Point, str]: The next point and its value
+        """
+        for row, line in enumerate(self.cells.tolist()):
+            for column, value in enumerate(line):
+                yield (column, row), chr(value)
+
+    def points_for_value(self, value: str) -> list[Point]:
+        """Get all points holding a given value, row by row.
+
+        Args:
+            value (str): The value to look for
+
+        Returns:
+            list[Point]: The points with the value, empty when there are none
+        """
+        rows, columns = np.nonzero(self.mask(value))
+        return list(zip(columns.tolist(), rows.tolist(), strict=True))
+
+    def first_point_for_value(self, value: str) -> Point | None:
+        """Get the first point holding a given value, row by row.
+
+        Args:
+            value (str): The value to look for
+
+        Returns:
+            Point | None: The first point with the value or None when not found
+        """
+        indices = np.flatnonzero(self.mask(value))
+        if len(indices) == 0:
+            return None
+
+        row, column = divmod(int(indices[0]), self.width)
+        return column, row
+
+    def mask(self, value: str) -> "npt.NDArray[np.bool_]":
+        """Get a mask of all cells holding a given value.
+
+        Args:
+            value (str): The value to look for
+
+        Returns:
+            npt.NDArray[np.bool_]: True for every cell with the value
+        """
+        return self.cells == ord(value)
+
+    def count(self, value: str) -> int:
+        """Count the cells holding a given value.
+
+        Args:
+            value (str): The value to count
+
+        Returns:
+            int: The number of cells with the value
+        """
+        return int(np.count_nonzero(self.mask(value)))
+
+    def shifted(self, delta: Point) -> "npt.NDArray[np.uint8]":
+        """Get a view of the neighbour of every cell in a given direction.
+
+        The value at [row, column] of the view is the value of the cell at
+        (column + delta[0], row + delta[1]), or zero when that lies outside the
+        grid.
+
+        Args:
+            delta (Point): The direction of the neighbour, at most one step in
+                each axis
+
+        Returns:
+            npt.NDArray[np.uint8]: The neighbour values, as a view on the grid
+
+        Raises:
+            ValueError: If the delta is more than one step in an axis
+        """
+        delta_column, delta_row = delta
+        if abs(delta_column) > 1 or abs(delta_row) > 1:
+            msg = f"Only direct neighbours can be shifted to, got {delta}"
+            raise ValueError(msg)
+
+        return self._padded[
+            1 + delta_row : 1 + delta_row + self.height,
+            1 + delta_column : 1 + delta_column + self.width,
+        ]
+
+    def neighbours(self, *, diagonal: bool = False) -> list["npt.NDArray[np.uint8]"]:
+        """Get views of the neighbours of every cell.
+
+        Args:
+            diagonal (bool): Include the diagonal neighbours as well
+
+        Returns:
+            list[npt.NDArray[np.uint8]]: One shifted view per direction, in the
+                order of NEIGHBOUR_DELTAS_4 or NEIGHBOUR_DELTAS_8
+        """
+        deltas = NEIGHBOUR_DELTAS_8 if diagonal else NEIGHBOUR_DELTAS_4
+        return [self.shifted(delta) for delta in deltas]
+
+    def count_neighbours(
+        self, value: str, *, diagonal: bool = False
+    ) -> "npt.NDArray[np.uint8]":
+        """Count for every cell how many of its neighbours hold a given value.
+
+        Args:
+            value (str): The value to count
+            diagonal (bool): Include the diagonal neighbours as well
+
+        Returns:
+            npt.NDArray[np.uint8]: The number of matching neighbours per cell
+        """
+        byte_value = ord(value)
+        counts = np.zeros((self.height, self.width), dtype=np.uint8)
+        for neighbour in self.neighbours(diagonal=diagonal):
+            counts += neighbour == byte_value
+
+        return counts
+
+
+class BlockerJumpTable:
+    """Precomputed lookups of the next blocking cell in each straight direction.
+
+    For every cell and each of the four directions in NEIGHBOUR_DELTAS_4 the table
+    holds the first cell further along that direction which contains a blocker,
+    so walking in a straight line until something is hit takes a single lookup.
+    Horizontal lookups are stored row-major and vertical lookups column-major,
+    which keeps every ray a contiguous slice so the tables can be built and
+    updated with slice assignments.
+
+    The table only holds the blocker positions, not the grid itself, so it can be
+    shared with other processes cheaply.
+    """
+
+    __slots__ = ("_down", "_is_blocker", "_left", "_right", "_up", "height", "width")
+
+    def __init__(self, grid: Grid | ArrayGrid, blocker: str) -> None:
+        """Build the jump tables for a grid.
+
+        Args:
+            grid (Grid | ArrayGrid): The grid to build the tables for
+            blocker (str): The value of the cells that block movement
+        """
+        self.width = grid.width
+        self.height = grid.height
+
+        size = self.width * self.height
+        self._is_blocker = bytearray(size)
+        self._right = array("i", [-1]) * size
+        self._left = array("i", [-1]) * size
+        self._down = array("i", [-1]) * size
+        self._up = array("i", [-1]) * size
+
+        blockers_per_row: list[list[int]] = [[] for _ in range(self.height)]
+        blockers_per_column: list[list[int]] = [[] for _ in range(self.width)]
+        for column, row in grid.points_for_value(blocker):
+            self._is_blocker[row * self.width + column] = 1
+            blockers_per_row[row].append(column)
+            blockers_per_column[column].append(row)
+
+        for row, blocker_columns in enumerate(blockers_per_row):
+            self._fill_rays(
+                self._right, self._left, row * self.width, self.width, blocker_columns
+            )
+        for column, blocker_rows in enumerate(blockers_per_column):
+            self._fill_rays(
+                self._down, self._up, column * self.height, self.height, blocker_rows
+            )
+
+    def next_blocker(
+        self, point: Point, direction: Point, extra_blocker: Point | None = None
+    ) -> Point | None:
+        """Get the first blocker strictly beyond a point in a given direction.
+
+        An extra blocker can be given to look up the blockers as if it were
+        added, without modifying the table. This allows a single table to be
+        shared while trying out different blockers.
+
+        Args:
+            point (Point): The point to look from
+            direction (Point): The direction to look in, one of NEIGHBOUR_DELTAS_4
+            extra_blocker (Point | None): A point to treat as a blocker as well
+
+        Returns:
+            Point | None: The first blocking point, None when there is none
+
+        Raises:
+            ValueError: If the direction is not a straight unit step
+        """
+        column, row = point
+        match direction:
+            case (1, 0):
+                next_column = self._right[row * self.width + column]
+                blocker = None if next_column < 0 else (next_column, row)
+            case (-1, 0):
+                next_column = self._left[row * self.width + column]
+                blocker = None if next_column < 0 else (next_column, row)
+            case (0, 1):
+                next_row = self._down[column * self.height + row]
+                blocker = None if next_row < 0 else (column, next_row)
+            case (0, -1):
+                next_row = self._up[column * self.height + row]
+                blocker = None if next_row < 0 else (column, next_row)
+            case _:
+                msg = f"Expected a straight unit direction, got {direction}"
+                raise ValueError(msg)
+
+        if extra_blocker is None:
+            return blocker
+
+        # The extra blocker wins when it is on the ray, before the other blocker
+        delta_column, delta_row = direction
+        offset_column, offset_row = extra_blocker[0] - column, extra_blocker[1] - row
+        distance = offset_column * delta_column + offset_row * delta_row
+        if distance <= 0 or (offset_column, offset_row) != (
+            distance * delta_column,
+            distance * delta_row,
+        ):
+            return blocker
+        if blocker is not None and (
+            abs(blocker[0] - column) + abs(blocker[1] - row) < distance
+        ):
+            return blocker
+        return extra_blocker
+
+    def is_blocker(self, point: Point) -> bool:
+        """Check if a point is a blocker.
+
+        Args:
+            point (Point): The point to check
+
+        Returns:
+            bool: True if the point blocks movement
+        """
+        column, row = point
+        return self._is_blocker[row * self.width + column] == 1
+
+    def add_blocker(self, point: Point) -> None:
+        """Turn a point into a blocker, updating only the rays passing through it.
+
+        Args:
+            point (Point): The point to block
+        """
+        column, row = point
+        if self._is_blocker[row * self.width + column]:
+            return
+
+        self._is_blocker[row * self.width + column] = 1
+        self._update_rays_through(column, row, blocked=True)
+
+    def remove_blocker(self, point: Point) -> None:
+        """Clear a blocker, updating only the rays passing through it.
+
+        Args:
+            point (Point): The point to clear
+        """
+        column, row = point
+        if not self._is_blocker[row * self.width + column]:
+            return
+
+        self._is_blocker[row * self.width + column] = 0
+        self._update_rays_through(column, row, blocked=False)
+
+    @staticmethod
+    def _fill_rays(
+        forward: array[int],
+        backward: array[int],
+        start: int,
+        length: int,
+        blockers: list[int],
+    ) -> None:
+        # Fill one row or column, given the sorted offsets of its blockers
+        previous = -1
+        for blocker in [*blockers, length]:
+            first = max(previous, 0)
+            if blocker < length:
+                forward[start + first : start + blocker] = array("i", [blocker]) * (
+                    blocker - first
+                )
+            if previous >= 0:
+                end = min(blocker, length - 1)
+                backward[start + previous + 1 : start + end + 1] = array(
+                    "i", [previous]
+                ) * (end - previous)
+            previous = blocker
+
+    def _update_rays_through(self, column: int, row: int, *, blocked: bool) -> None:
+        # The lookups of a cell always point strictly beyond it, so the rays from
+        # the blocker before this cell up to the blocker after it are the only ones
+        # that change. They either stop here or continue to the blocker beyond.
+        row_start = row * self.width
+        previous_column = self._left[row_start + column]
+        next_column = self._right[row_start + column]
+        first = row_start + max(previous_column, 0)
+        last = row_start + (next_column if next_column >= 0 else self.width - 1)
+        self._right[first : row_start + column] = array(
+            "i", [column if blocked else next_column]
+        ) * (row_start + column - first)
+        self._left[row_start + column + 1 : last + 1] = array(
+            "i", [column if blocked else previous_column]
+        ) * (last - row_start - column)
+
+        column_start = column * self.height
+        previous_row = self._up[column_start + row]
+        next_row = self._down[column_start + row]
+        first = column_start + max(previous_row, 0)
+        last = column_start + (next_row if next_row >= 0 else self.height - 1)
+        self._down[first : column_start + row] = array(
+            "i", [row if blocked else next_row]
+        ) * (column_start + row - first)
+        self._up[column_start + row + 1 : last + 1] = array(
+            "i", [row if blocked else previous_row]
+        ) * (last - column_start - row)
+
+
+class StateTracker:
+    """Remembers which states have been seen in which cells of a grid.
+
+    A state is a small number per cell, like the direction a walker faces, so a
+    (point, state) combination can be checked without building tuples or set
+    entries. Every combination takes a single byte in a reusable buffer holding
+    the generation in which it was last seen. Resetting the tracker only starts
+    a new generation, the buffer is only cleared when the generations run out.
+    """
+
+    __slots__ = ("_generation", "_stamps", "height", "states", "width")
+
+    def __init__(self, width: int, height: int, states: int = 4) -> None:
+        """Create a tracker for a grid of a given size.
+
+        Args:
+            width (int): The width of the grid
+            height (int): The height of the grid
+            states (int): The number of different states per cell
+        """
+        self.width = width
+        self.height = height
+        self.states = states
+        self._stamps = bytearray(width * height * states)
+        self._generation = 1
+
+    def reset(self) -> None:
+        """Forget all seen states."""
+        self._generation += 1
+        if self._generation > _MAX_GENERATION:
+            self._stamps = bytearray(len(self._stamps))
+            self._generation = 1
+
+    def visit(self, point: Point, state: int) -> bool:
+        """Mark a state in a cell as seen.
+
+        Args:
+            point (Point): The cell
+            state (int): The state in the cell
+
+        Returns:
+            bool: True if the state was already seen in the cell
+        """
+        column, row = point
+        index = (row * self.width + column) * self.states + state
+        if self._stamps[index] == self._generation:
+            return True
+
+        self._stamps[index] = self._generation
+        return False
+
+    def is_visited(self, point: Point, state: int) -> bool:
+        """Check if a state has been seen in a cell.
+
+        Args:
+            point (Point): The cell
+            state (int): The state in the cell
+
+        Returns:
+            bool: True if the state was seen in the cell
+        """
+        column, row = point
+        index = (row * self.width + column) * self.states + state
+        return self._stamps[index] == self._generation
+
+    def visited_points(self) -> set[Point]:
+        """Get all cells in which any state has been seen.
+
+        Returns:
+            set[Point]: The cells with a seen state
+        """
+        cell_width = self.width * self.states
+        visited_points: set[Point] = set()
+        index = self._stamps.find(self._generation)
+        while index >= 0:
+            row, offset = divmod(index, cell_width)
+            visited_points.add((offset // self.states, row))
+            index = self._stamps.find(self._generation, index + 1)
+
+        return visited_points
 
 
 def create_grid_from_lines(lines: list[str]) -> Grid:
@@ -10,28 +730,113 @@ def create_grid_from_lines(lines: list[str]) -> Grid:
 
     Returns:
         Grid: The created grid
+
+    Raises:
+        ValueError: If not all lines have the same length
+    """
+    width, height, cells = _encode_lines(lines)
+    return DenseGrid(width, height, cells)
+
+
+def create_array_grid_from_lines(lines: list[str]) -> ArrayGrid | DenseGrid:
+    """Create a NumPy backed grid from lines, if NumPy is available.
+
+    Args:
+        lines (list[str]): All lines describing the grid
+
+    Returns:
+        ArrayGrid | DenseGrid: An ArrayGrid, or a DenseGrid when NumPy is missing
+
+    Raises:
+        ValueError: If not all lines have the same length
     """
-    grid: Grid = {}
+    width, height, cells = _encode_lines(lines)
+    if np is None:
+        return DenseGrid(width, height, cells)
+
+    return ArrayGrid(np.frombuffer(cells, dtype=np.uint8).reshape(height, width))
 
+
+def _encode_lines(lines: list[str]) -> tuple[int, int, bytearray]:
+    height = len(lines)
+    width = len(lines[0]) if height > 0 else 0
+
+    cells = bytearray()
     for row_index, line in enumerate(lines):
-        for column_index, value in enumerate(line):
-            grid[column_index, row_index] = value
+        if len(line) != width:
+            msg = f"Line {row_index + 1}: Expected {width} cells, got {len(line)}"
+            raise ValueError(msg)
+        cells += line.encode("ascii")
 
-    return grid
+    return width, height, cells
 
 
-def find_first_point_for_value(grid: Grid, target_value: str) -> Point | None:
+def find_first_point_for_value(
+    grid: Grid | ArrayGrid, target_value: str
+) -> Point | None:
     """Find the first point in the grid containing a given value.
 
     Args:
-        grid (Grid): The grid to search
+        grid (Grid | ArrayGrid): The grid to search
         target_value (str): The value to find
 
     Returns:
         Point | None: First point with the value or None when not found
     """
-    for point, value in grid.items():
-        if target_value == value:
-            return point
+    return grid.first_point_for_value(target_value)
+
+
+def find_all_points_for_value(grid: Grid | ArrayGrid, target_value: str) -> list[Point]:
+    """Find all points in the grid containing a given value.
+
+    Args:
+        grid (Grid | ArrayGrid): The grid to search
+        target_value (str): The value to find
+
+    Returns:
+        list[Point]: All points with the value, row by row
+    """
+    return grid.points_for_value(target_value)
+
+
+def load_grid_from_file(file_path: str) -> Grid:
+    """Load a grid from a file without copying its contents.
+
+    The file is memory-mapped and the grid is a view over the mapped bytes, so
+    loading takes constant time regardless of the file size and the pages are
+    shared with any other process mapping the same file. Setting cells only
+    changes the grid, never the file on disk.
+
+    Args:
+        file_path (str): The file to load the grid from
+
+    Returns:
+        Grid: The loaded grid
+
+    Raises:
+        ValueError: If the file size does not match rows of equal length
+    """
+    with Path(file_path).open("rb") as file:
+        if Path(file_path).stat().st_size == 0:
+            return DenseGrid(0, 0, bytearray())
+
+        cells = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    line_break_index = cells.find(b"\n")
+    if line_break_index < 0:
+        return DenseGrid(len(cells), 1, cells)
+
+    width = line_break_index
+    if width > 0 and cells[width - 1] == ord("\r"):
+        width -= 1
+    stride = line_break_index + 1
+
+    height, remainder = divmod(len(cells), stride)
+    if remainder == width:
+        # The last row is not followed by a line break
+        height += 1
+    elif remainder != 0:
+        msg = f"Expected rows of {width} cells in {file_path}"
+        raise ValueError(msg)
 
-    return None
+    return DenseGrid(width, height, cells, stride)
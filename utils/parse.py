@@ -0,0 +1,261 @@
+from array import array
+from collections.abc import Iterator
+from itertools import accumulate
+
+from utils.file import read_byte_chunks_from_file
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+# Every value of up to 18 digits fits in 64 bits
+_MAX_SAFE_DIGITS = 18
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class IntegerRows:
+    """Rows of integers stored as one flat array with row offsets.
+
+    Row i consists of values[offsets[i]:offsets[i + 1]]. Every line of the parsed
+    input is a row, including empty lines, so row i always comes from line i + 1.
+    """
+
+    __slots__ = ("offsets", "values")
+
+    def __init__(self, values: array[int], offsets: array[int]) -> None:
+        """Create the rows from flat values and row offsets.
+
+        Args:
+            values (array[int]): All values, row after row
+            offsets (array[int]): The start of every row, followed by the end of
+                the last row
+        """
+        self.values = values
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        """Get the number of rows.
+
+        Returns:
+            int: The number of rows
+        """
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> list[int]:
+        """Get the values of a single row.
+
+        Args:
+            index (int): The index of the row
+
+        Returns:
+            list[int]: The values of the row
+        """
+        return self.values[self.offsets[index] : self.offsets[index + 1]].tolist()
+
+    def __iter__(self) -> Iterator[list[int]]:
+        """Iterate over the values of all rows.
+
+        Yields:
+            list[int]: The values of the next row
+        """
+        values = self.values.tolist()
+        for start, end in zip(self.offsets, self.offsets[1:], strict=False):
+            yield values[start:end]
+
+    def extend(self, rows: "IntegerRows") -> None:
+        """Append the given rows after the existing rows.
+
+        Args:
+            rows (IntegerRows): The rows to append
+        """
+        value_count = len(self.values)
+        self.values.extend(rows.values)
+        self.offsets.extend(offset + value_count for offset in rows.offsets[1:])
+
+    def row_lengths(self) -> list[int]:
+        """Get the number of values in every row.
+
+        Returns:
+            list[int]: The number of values per row
+        """
+        return [
+            end - start
+            for start, end in zip(self.offsets, self.offsets[1:], strict=False)
+        ]
+
+
+def parse_integers(
+    data: bytes, separators: str = "", first_line_number: int = 1
+) -> IntegerRows:
+    """Parse all integers from a buffer, one row per line.
+
+    Values are always separated by whitespace, any of the given separator
+    characters separate values as well. The whole buffer is converted in bulk
+    instead of line by line: with NumPy installed the digits are decoded with
+    array operations straight from the bytes, otherwise the buffer is split and
+    converted with a handful of calls that each process all values at once.
+    Only the NumPy path is substantially faster than parsing line by line, as
+    without it one int() call per value dominates the cost either way.
+
+    Args:
+        data (bytes): The ASCII buffer to parse
+        separators (str): Additional characters that separate values, like ",",
+            "|" or ":"
+        first_line_number (int): The line number of the first line in the
+            buffer, used in error messages
+
+    Returns:
+        IntegerRows: The parsed values per line
+
+    Raises:
+        ValueError: If a value is not a 64-bit integer, the line number is part of
+            the message
+    """
+    if separators:
+        data = data.translate(
+            bytes.maketrans(separators.encode("ascii"), b" " * len(separators))
+        )
+
+    if np is not None:
+        rows = _parse_integers_with_numpy(data)
+        if rows is not None:
+            return rows
+
+    return _parse_integers_with_python(data, first_line_number)
+
+
+def parse_integer_lines(lines: list[str], separators: str = "") -> IntegerRows:
+    """Parse all integers from already read lines, one row per line.
+
+    Args:
+        lines (list[str]): The lines to parse
+        separators (str): Additional characters that separate values
+
+    Returns:
+        IntegerRows: The parsed values per line
+
+    Raises:
+        ValueError: If a value is not a 64-bit integer
+    """
+    return parse_integers("\n".join([*lines, ""]).encode("ascii"), separators)
+
+
+def read_integers_from_file(
+    file_path: str, separators: str = "", chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> IntegerRows:
+    """Read all integers from a given file, one row per line.
+
+    The file is parsed in chunks of whole lines, so next to the parsed values
+    only a single chunk of the file is held in memory at a time.
+
+    Args:
+        file_path (str): The file to read the integers from
+        separators (str): Additional characters that separate values
+        chunk_size (int): The number of bytes to read and parse at a time
+
+    Returns:
+        IntegerRows: The parsed values per line
+
+    Raises:
+        ValueError: If a value is not a 64-bit integer
+    """
+    rows = IntegerRows(array("q"), array("q", [0]))
+    for chunk in read_byte_chunks_from_file(file_path, chunk_size):
+        rows.extend(parse_integers(chunk, separators, len(rows) + 1))
+
+    return rows
+
+
+def _parse_integers_with_python(data: bytes, first_line_number: int) -> IntegerRows:
+    text = data.decode("ascii")
+    lines = text.split("\n")
+    if lines[-1] == "":
+        # A trailing line break does not start another line
+        lines.pop()
+
+    try:
+        values = array("q", list(map(int, text.split())))
+    except (ValueError, OverflowError):
+        _raise_for_first_invalid_line(lines, first_line_number)
+        raise
+
+    offsets = array("q", accumulate(map(len, map(str.split, lines)), initial=0))
+    return IntegerRows(values, offsets)
+
+
+def _parse_integers_with_numpy(data: bytes) -> IntegerRows | None:
+    # Decodes all digit runs at once. Anything unusual, like invalid characters or
+    # values that might not fit in 64 bits, returns None so the Python parser can
+    # handle it and report the offending line.
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    digits = buffer - np.uint8(ord("0"))
+    is_digit = digits < 10  # noqa: PLR2004
+    is_minus = buffer == ord("-")
+    is_space = (buffer == ord(" ")) | ((buffer >= ord("\t")) & (buffer <= ord("\r")))
+    if not np.all(is_digit | is_minus | is_space):
+        return None
+
+    minus_positions = np.flatnonzero(is_minus)
+    if len(minus_positions) > 0:
+        followed_by_digit = minus_positions + 1 < len(buffer)
+        followed_by_digit[followed_by_digit] = is_digit[
+            minus_positions[followed_by_digit] + 1
+        ]
+        preceded_by_space = minus_positions == 0
+        preceded_by_space[~preceded_by_space] = is_space[
+            minus_positions[~preceded_by_space] - 1
+        ]
+        if not np.all(followed_by_digit & preceded_by_space):
+            return None
+
+    edges = np.flatnonzero(np.diff(is_digit, prepend=False, append=False))
+    starts, ends = edges[0::2], edges[1::2]
+    lengths = ends - starts
+    if len(lengths) > 0 and lengths.max() > _MAX_SAFE_DIGITS:
+        return None
+
+    # Horner's method over all values at once, one digit position per step. Only
+    # positions past the shortest value need to leave the shorter values alone.
+    values = np.zeros(len(starts), dtype=np.int64)
+    if len(starts) > 0:
+        for digit_offset in range(int(lengths.min())):
+            values = values * 10 + digits[starts + digit_offset]
+        for digit_offset in range(int(lengths.min()), int(lengths.max())):
+            next_digits = digits[np.minimum(starts + digit_offset, len(digits) - 1)]
+            values = np.where(lengths > digit_offset, values * 10 + next_digits, values)
+
+    if len(minus_positions) > 0:
+        negative = np.zeros(len(starts), dtype=np.bool_)
+        negative[starts > 0] = is_minus[starts[starts > 0] - 1]
+        values[negative] *= -1
+
+    line_ends = np.searchsorted(starts, np.flatnonzero(buffer == ord("\n")))
+    offsets = array("q", [0])
+    offsets.frombytes(line_ends.astype(np.int64).tobytes())
+    if len(data) > 0 and data[-1] != ord("\n"):
+        # The last line is not followed by a line break
+        offsets.append(len(starts))
+
+    parsed_values = array("q")
+    parsed_values.frombytes(values.astype(np.int64).tobytes())
+    return IntegerRows(parsed_values, offsets)
+
+
+def _raise_for_first_invalid_line(lines: list[str], first_line_number: int) -> None:
+    # Only used when parsing failed, so speed does not matter here
+    for line_number, line in enumerate(lines, start=first_line_number):
+        for value in line.split():
+            try:
+                parsed_value = int(value)
+            except ValueError as e:
+                msg = f"Line {line_number}: {e}"
+                raise ValueError(msg) from e
+
+            if not INT64_MIN <= parsed_value <= INT64_MAX:
+                msg = f"Line {line_number}: {value} does not fit in 64 bits"
+                raise ValueError(msg)
@@ -0,0 +1,44 @@
+import multiprocessing
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+# A few batches per worker keeps them all busy when some batches take longer
+BATCHES_PER_WORKER = 4
+
+
+def run_in_process_pool[T, R](
+    initializer: Callable[..., object],
+    initargs: tuple[object, ...],
+    function: Callable[[T], R],
+    batches: Iterable[T],
+    workers: int,
+) -> list[R]:
+    """Apply a function to batches of work in worker processes.
+
+    The initializer is called once in every worker with the initargs, to set up
+    the state that all batches share. Workers are started with the fork start
+    method where available, so they inherit that state instead of unpickling a
+    copy of it.
+
+    Args:
+        initializer (Callable[..., object]): Sets up the shared state in a worker
+        initargs (tuple[object, ...]): The arguments for the initializer
+        function (Callable[[T], R]): The function to apply to every batch
+        batches (Iterable[T]): The batches of work
+        workers (int): The number of worker processes
+
+    Returns:
+        list[R]: The results, in the order of the batches
+    """
+    context = (
+        multiprocessing.get_context("fork")
+        if "fork" in multiprocessing.get_all_start_methods()
+        else None
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        return list(executor.map(function, batches))
@@ -0,0 +1,151 @@
+"""Run a puzzle solution and time each part.
+
+Usage:
+    python -m utils.runner 2024 7 [--input FILE] [--part {1,2}]
+"""
+
+import argparse
+import importlib
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class PartResult(NamedTuple):
+    """The solution for a single part with its timings in seconds."""
+
+    part: int
+    solution: Any
+    parse_time: float
+    wall_time: float
+    cpu_time: float
+
+
+def get_solution_module(year: int, day: int) -> ModuleType:
+    """Import the solution module for a given puzzle.
+
+    Args:
+        year (int): The year of the puzzle
+        day (int): The day of the puzzle
+
+    Returns:
+        ModuleType: The imported solution module
+    """
+    return importlib.import_module(f"year{year}.day{day:02d}.solution_{year}_{day:02d}")
+
+
+def get_default_input_path(solution_module: ModuleType) -> Path:
+    """Get the path of the input file next to a solution module.
+
+    Args:
+        solution_module (ModuleType): The solution module
+
+    Returns:
+        Path: The path of the default input file
+    """
+    return Path(str(solution_module.__file__)).with_name("input.txt")
+
+
+def run_part(solution_module: ModuleType, part: int, input_path: Path) -> PartResult:
+    """Parse the input and solve a single part, timing both.
+
+    The input is parsed again for every part, as solutions are allowed to modify
+    their parsed input.
+
+    Args:
+        solution_module (ModuleType): The solution module
+        part (int): The part to solve, 1 or 2
+        input_path (Path): The puzzle input file
+
+    Returns:
+        PartResult: The solution and the timings
+    """
+    parse_input: Callable[[str], Any] = solution_module.parse_input
+    solve: Callable[[Any], Any] = getattr(solution_module, f"solve_part{part}")
+
+    parse_start = time.perf_counter()
+    parsed_input = parse_input(str(input_path))
+    parse_time = time.perf_counter() - parse_start
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    solution = solve(parsed_input)
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    return PartResult(part, solution, parse_time, wall_time, cpu_time)
+
+
+def run_day(
+    year: int,
+    day: int,
+    input_path: Path | None = None,
+    parts: tuple[int, ...] = (1, 2),
+) -> list[PartResult]:
+    """Solve the given parts of a puzzle.
+
+    Args:
+        year (int): The year of the puzzle
+        day (int): The day of the puzzle
+        input_path (Path | None): The puzzle input file, defaults to input.txt
+            next to the solution
+        parts (tuple[int, ...]): The parts to solve
+
+    Returns:
+        list[PartResult]: The results per part
+    """
+    solution_module = get_solution_module(year, day)
+    if input_path is None:
+        input_path = get_default_input_path(solution_module)
+
+    return [run_part(solution_module, part, input_path) for part in parts]
+
+
+def format_duration(seconds: float) -> str:
+    """Format a duration for display.
+
+    Args:
+        seconds (float): The duration in seconds
+
+    Returns:
+        str: The formatted duration
+    """
+    return f"{seconds * 1000:10.3f} ms"
+
+
+def main(arguments: list[str] | None = None) -> None:
+    """Main entry point for the runner.
+
+    Args:
+        arguments (list[str] | None): The command line arguments, defaults to
+            sys.argv
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("year", type=int, help="the year of the puzzle")
+    parser.add_argument("day", type=int, help="the day of the puzzle")
+    parser.add_argument(
+        "-i", "--input", type=Path, help="the input file, defaults to input.txt"
+    )
+    parser.add_argument(
+        "-p", "--part", type=int, choices=(1, 2), help="only solve a single part"
+    )
+    parsed_arguments = parser.parse_args(arguments)
+
+    parts = (1, 2) if parsed_arguments.part is None else (parsed_arguments.part,)
+    results = run_day(
+        parsed_arguments.year, parsed_arguments.day, parsed_arguments.input, parts
+    )
+
+    for result in results:
+        print(f"Part {result.part}: {result.solution}")
+        print(f"  parse {format_duration(result.parse_time)}")
+        print(f"  wall  {format_duration(result.wall_time)}")
+        print(f"  cpu   {format_duration(result.cpu_time)}")
+
+
+if __name__ == "__main__":
+    main()
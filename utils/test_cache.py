@@ -0,0 +1,113 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from utils.cache import cached_parser, evict_from_cache
+
+
+@pytest.fixture
+def cache_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the cache to a temporary directory."""
+    cache_directory = tmp_path / "cache"
+    monkeypatch.setenv("AOC_CACHE_DIR", str(cache_directory))
+    monkeypatch.delenv("AOC_NO_CACHE", raising=False)
+    return cache_directory
+
+
+def test_cached_parser_skips_parsing_on_warm_runs(
+    cache_directory: Path, tmp_path: Path
+) -> None:
+    """Test that an unchanged input is only parsed once."""
+    number_of_parses = 0
+
+    @cached_parser(version=1)
+    def parse(file_path: str) -> list[int]:
+        nonlocal number_of_parses
+        number_of_parses += 1
+        return [int(value) for value in Path(file_path).read_text().split()]
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+
+    assert parse(str(input_file)) == [1, 2, 3]
+    assert parse(str(input_file)) == [1, 2, 3]
+    assert number_of_parses == 1
+    assert len(list(cache_directory.iterdir())) == 1
+
+    input_file.write_text("4 5")
+    assert parse(str(input_file)) == [4, 5]
+    assert number_of_parses == 2  # noqa: PLR2004
+
+
+def test_cached_parser_ignores_stale_entries(
+    cache_directory: Path, tmp_path: Path
+) -> None:
+    """Test that entries that cannot be unpickled are parsed again."""
+    number_of_parses = 0
+
+    @cached_parser(version=1)
+    def parse(file_path: str) -> str:
+        nonlocal number_of_parses
+        number_of_parses += 1
+        return Path(file_path).read_text()
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+    assert parse(str(input_file)) == "1 2 3"
+
+    # A pickled reference to a class that no longer exists
+    (cache_file,) = cache_directory.iterdir()
+    cache_file.write_bytes(b"cutils.cache\nRemovedClass\n.")
+    assert parse(str(input_file)) == "1 2 3"
+    assert number_of_parses == 2  # noqa: PLR2004
+
+
+def test_cached_parser_with_read_only_cache(
+    cache_directory: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that warm runs work when cache entries cannot be touched."""
+
+    @cached_parser(version=1)
+    def parse(file_path: str) -> str:
+        return Path(file_path).read_text()
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+    assert parse(str(input_file)) == "1 2 3"
+
+    def deny_touch(_: Path) -> None:
+        raise PermissionError
+
+    monkeypatch.setattr(Path, "touch", deny_touch)
+    assert parse(str(input_file)) == "1 2 3"
+    assert len(list(cache_directory.iterdir())) == 1
+
+
+def test_cached_parser_can_be_disabled(
+    cache_directory: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that nothing is cached when caching is disabled."""
+    monkeypatch.setenv("AOC_NO_CACHE", "1")
+
+    @cached_parser(version=1)
+    def parse(file_path: str) -> str:
+        return Path(file_path).read_text()
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3")
+
+    assert parse(str(input_file)) == "1 2 3"
+    assert not cache_directory.exists()
+
+
+def test_evict_from_cache_removes_least_recently_used(tmp_path: Path) -> None:
+    """Test that the oldest entries are evicted first."""
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        cache_file = tmp_path / f"{name}.pickle"
+        cache_file.write_bytes(b"x" * 10)
+        modified_time = 1_000_000 - age
+        os.utime(cache_file, (modified_time, modified_time))
+
+    evict_from_cache(tmp_path, 20)
+    assert sorted(path.stem for path in tmp_path.iterdir()) == ["middle", "newest"]
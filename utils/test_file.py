@@ -0,0 +1,77 @@
+from pathlib import Path
+
+import pytest
+
+from utils.file import (
+    iterate_byte_lines_from_file,
+    iterate_lines_from_file,
+    read_all_lines_from_file,
+    read_byte_chunks_from_file,
+    read_lines_in_chunks,
+)
+
+
+@pytest.fixture
+def lines_file(tmp_path: Path) -> str:
+    """Create a file with a few lines with trailing whitespace."""
+    file_path = tmp_path / "lines.txt"
+    file_path.write_text("1 2  \n3 4\n5 6\n\n7 8")
+    return str(file_path)
+
+
+def test_iterate_lines_from_file(lines_file: str) -> None:
+    """Test lazily reading lines."""
+    lines = iterate_lines_from_file(lines_file)
+    assert next(lines) == "1 2"
+    assert list(lines) == ["3 4", "5 6", "", "7 8"]
+
+
+def test_iterate_byte_lines_from_file(lines_file: str) -> None:
+    """Test lazily reading lines as bytes."""
+    assert list(iterate_byte_lines_from_file(lines_file)) == [
+        b"1 2",
+        b"3 4",
+        b"5 6",
+        b"",
+        b"7 8",
+    ]
+
+
+def test_read_lines_in_chunks(lines_file: str) -> None:
+    """Test reading lines in chunks."""
+    assert list(read_lines_in_chunks(lines_file, 2)) == [
+        ["1 2", "3 4"],
+        ["5 6", ""],
+        ["7 8"],
+    ]
+
+    with pytest.raises(ValueError, match="positive"):
+        next(read_lines_in_chunks(lines_file, 0))
+
+
+def test_read_byte_chunks_from_file(lines_file: str) -> None:
+    """Test reading chunks of whole lines as bytes."""
+    assert list(read_byte_chunks_from_file(lines_file, 8)) == [
+        b"1 2  \n",
+        b"3 4\n5 6\n\n",
+        b"7 8",
+    ]
+    assert list(read_byte_chunks_from_file(lines_file, 1)) == [
+        b"1 2  \n",
+        b"3 4\n",
+        b"5 6\n",
+        b"\n",
+        b"7 8",
+    ]
+    assert (
+        b"".join(read_byte_chunks_from_file(lines_file, 1024))
+        == Path(lines_file).read_bytes()
+    )
+
+    with pytest.raises(ValueError, match="positive"):
+        next(read_byte_chunks_from_file(lines_file, 0))
+
+
+def test_read_all_lines_from_file(lines_file: str) -> None:
+    """Test reading all lines at once."""
+    assert read_all_lines_from_file(lines_file) == ["1 2", "3 4", "5 6", "", "7 8"]
@@ -0,0 +1,158 @@
+from pathlib import Path
+
+import pytest
+
+from utils.grid import (
+    ArrayGrid,
+    BlockerJumpTable,
+    DenseGrid,
+    StateTracker,
+    create_array_grid_from_lines,
+    create_grid_from_lines,
+    find_all_points_for_value,
+    find_first_point_for_value,
+    load_grid_from_file,
+)
+
+
+def test_create_grid_from_lines() -> None:
+    """Test creating a dense grid from lines."""
+    grid = create_grid_from_lines(["ab.", "#^c"])
+    assert isinstance(grid, DenseGrid)
+    assert grid.width == 3  # noqa: PLR2004
+    assert grid.height == 2  # noqa: PLR2004
+    assert grid[0, 0] == "a"
+    assert grid[2, 1] == "c"
+    assert list(grid.items())[3] == ((0, 1), "#")
+
+
+def test_grid_membership_and_mutation() -> None:
+    """Test membership checks and setting values in a dense grid."""
+    grid = create_grid_from_lines(["...", "..."])
+    assert (2, 1) in grid
+    assert (3, 1) not in grid
+    assert (-1, 0) not in grid
+
+    grid[1, 1] = "#"
+    assert grid[1, 1] == "#"
+    assert find_first_point_for_value(grid, "#") == (1, 1)
+
+    with pytest.raises(KeyError):
+        grid[3, 0] = "#"
+
+
+def test_create_grid_from_lines_with_uneven_lines() -> None:
+    """Test that lines of different lengths are rejected."""
+    with pytest.raises(ValueError, match="Line 2"):
+        create_grid_from_lines(["...", ".."])
+
+
+def test_find_all_points_for_value_follows_mutations() -> None:
+    """Test that the value index is kept up to date when cells change."""
+    grid = create_grid_from_lines(["#..", ".#.", "..#"])
+    assert find_all_points_for_value(grid, "#") == [(0, 0), (1, 1), (2, 2)]
+
+    grid[1, 0] = "#"
+    grid[1, 1] = "."
+    assert find_all_points_for_value(grid, "#") == [(0, 0), (1, 0), (2, 2)]
+    assert find_all_points_for_value(grid, "^") == []
+
+    grid[0, 0] = "^"
+    assert find_first_point_for_value(grid, "^") == (0, 0)
+    assert find_first_point_for_value(grid, "#") == (1, 0)
+
+
+def test_load_grid_from_file(tmp_path: Path) -> None:
+    """Test loading a memory-mapped grid from file."""
+    file_path = tmp_path / "grid.txt"
+    file_path.write_bytes(b"..#\n.^.\n#..")
+
+    grid = load_grid_from_file(str(file_path))
+    assert (grid.width, grid.height, grid.stride) == (3, 3, 4)
+    assert grid[2, 0] == "#"
+    assert find_first_point_for_value(grid, "^") == (1, 1)
+    assert find_all_points_for_value(grid, "#") == [(2, 0), (0, 2)]
+    assert find_first_point_for_value(grid, "\n") is None
+
+    grid[1, 2] = "#"
+    assert find_all_points_for_value(grid, "#") == [(2, 0), (0, 2), (1, 2)]
+    assert file_path.read_bytes() == b"..#\n.^.\n#.."
+
+
+def test_array_grid_neighbours() -> None:
+    """Test vectorized masks and neighbour views of an array grid."""
+    pytest.importorskip("numpy")
+
+    grid = create_array_grid_from_lines(["#.#", ".^.", "#.."])
+    assert isinstance(grid, ArrayGrid)
+    assert grid.count("#") == 3  # noqa: PLR2004
+    assert grid[1, 1] == "^"
+    assert find_all_points_for_value(grid, "#") == [(0, 0), (2, 0), (0, 2)]
+    assert chr(grid.shifted((1, -1))[1, 1]) == "#"
+    assert grid.count_neighbours("#", diagonal=True)[1, 1] == 3  # noqa: PLR2004
+    assert grid.count_neighbours("#")[1, 1] == 0
+
+
+def test_create_array_grid_from_lines_without_numpy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the fallback to a dense grid when NumPy is not installed."""
+    monkeypatch.setattr("utils.grid.np", None)
+
+    grid = create_array_grid_from_lines(["#.", ".^"])
+    assert isinstance(grid, DenseGrid)
+    assert find_first_point_for_value(grid, "^") == (1, 1)
+
+
+def test_blocker_jump_table() -> None:
+    """Test next blocker lookups and updates of the jump table."""
+    grid = create_grid_from_lines(["..#..", ".....", "#...#", "....."])
+    jump_table = BlockerJumpTable(grid, "#")
+    assert jump_table.next_blocker((2, 3), (0, -1)) == (2, 0)
+    assert jump_table.next_blocker((1, 2), (1, 0)) == (4, 2)
+    assert jump_table.next_blocker((1, 2), (-1, 0)) == (0, 2)
+    assert jump_table.next_blocker((1, 2), (0, 1)) is None
+
+    jump_table.add_blocker((2, 2))
+    assert jump_table.next_blocker((2, 3), (0, -1)) == (2, 2)
+    assert jump_table.next_blocker((0, 2), (1, 0)) == (2, 2)
+    assert jump_table.next_blocker((4, 2), (-1, 0)) == (2, 2)
+    assert jump_table.is_blocker((2, 2))
+
+    jump_table.remove_blocker((2, 2))
+    assert jump_table.next_blocker((2, 3), (0, -1)) == (2, 0)
+    assert jump_table.next_blocker((0, 2), (1, 0)) == (4, 2)
+    assert not jump_table.is_blocker((2, 2))
+
+
+def test_blocker_jump_table_with_extra_blocker() -> None:
+    """Test next blocker lookups with an extra blocker that is not in the table."""
+    grid = create_grid_from_lines(["..#..", ".....", "#...#", "....."])
+    jump_table = BlockerJumpTable(grid, "#")
+    assert jump_table.next_blocker((2, 3), (0, -1), (2, 1)) == (2, 1)
+    assert jump_table.next_blocker((1, 2), (1, 0), (3, 2)) == (3, 2)
+    assert jump_table.next_blocker((1, 2), (0, 1), (1, 3)) == (1, 3)
+
+    # Behind the point or off the ray
+    assert jump_table.next_blocker((1, 2), (1, 0), (0, 2)) == (4, 2)
+    assert jump_table.next_blocker((0, 1), (0, -1), (2, 0)) is None
+    assert jump_table.next_blocker((1, 1), (1, 0), (3, 2)) is None
+    assert not jump_table.is_blocker((3, 2))
+
+
+def test_state_tracker() -> None:
+    """Test marking states as seen and forgetting them on reset."""
+    state_tracker = StateTracker(3, 2)
+    assert not state_tracker.visit((2, 1), 3)
+    assert state_tracker.visit((2, 1), 3)
+    assert not state_tracker.is_visited((2, 1), 0)
+    assert not state_tracker.visit((0, 1), 0)
+    assert state_tracker.visited_points() == {(2, 1), (0, 1)}
+
+    # Run through all generations, so the buffer gets cleared as well
+    for _ in range(300):
+        state_tracker.reset()
+        assert not state_tracker.is_visited((2, 1), 3)
+        assert not state_tracker.visit((1, 0), 2)
+
+    assert state_tracker.visited_points() == {(1, 0)}
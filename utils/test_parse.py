@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from utils.parse import parse_integer_lines, parse_integers, read_integers_from_file
+
+
+def test_parse_integers_rows_and_offsets() -> None:
+    """Test parsing a buffer into flat values and row offsets."""
+    rows = parse_integers(b"3 4\n\n-5  6 7\n")
+    assert len(rows) == 3  # noqa: PLR2004
+    assert rows.values.tolist() == [3, 4, -5, 6, 7]
+    assert rows.offsets.tolist() == [0, 2, 2, 5]
+    assert list(rows) == [[3, 4], [], [-5, 6, 7]]
+    assert rows[2] == [-5, 6, 7]
+
+
+def test_parse_integers_with_separators() -> None:
+    """Test parsing values split by additional separator characters."""
+    assert list(parse_integers(b"190: 10 19\n47|53", ":|")) == [[190, 10, 19], [47, 53]]
+    assert list(parse_integer_lines(["75,47,61", "97,61"], ",")) == [
+        [75, 47, 61],
+        [97, 61],
+    ]
+
+
+def test_parse_integers_reports_line_numbers() -> None:
+    """Test that invalid values are reported with their line number."""
+    with pytest.raises(ValueError, match="Line 2: invalid literal"):
+        parse_integers(b"1 2\n3 x\n")
+
+    with pytest.raises(ValueError, match=r"Line 3: .* does not fit in 64 bits"):
+        parse_integers(b"1\n2\n99999999999999999999\n")
+
+
+def test_read_integers_from_file_in_chunks(tmp_path: Path) -> None:
+    """Test that reading a file in small chunks gives the same rows."""
+    data = b"190: 10 19\n\n3267: 81 40 27\n-83: 17 5\n21037: 9 7 18 13"
+    file_path = tmp_path / "equations.txt"
+    file_path.write_bytes(data)
+
+    expected_rows = parse_integers(data, ":")
+    for chunk_size in (1, 7, 1024):
+        rows = read_integers_from_file(str(file_path), ":", chunk_size)
+        assert rows.values == expected_rows.values
+        assert rows.offsets == expected_rows.offsets
+
+    file_path.write_bytes(b"1 2\n3 4\n5 x\n")
+    with pytest.raises(ValueError, match="Line 3: invalid literal"):
+        read_integers_from_file(str(file_path), chunk_size=4)
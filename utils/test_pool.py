@@ -0,0 +1,24 @@
+from utils.pool import run_in_process_pool
+
+# The offset set up once per worker
+_offset: int
+
+
+def _set_offset(offset: int) -> None:
+    global _offset  # noqa: PLW0603
+    _offset = offset
+
+
+def _sum_with_offset(batch: list[int]) -> int:
+    return sum(batch) + _offset
+
+
+def test_run_in_process_pool() -> None:
+    """Test applying a function to batches with state set up per worker."""
+    batches = [[1, 2], [3], [], [4, 5, 6]]
+    assert run_in_process_pool(_set_offset, (100,), _sum_with_offset, batches, 2) == [
+        103,
+        103,
+        100,
+        115,
+    ]
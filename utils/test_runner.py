@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from utils.runner import main, run_day
+
+
+def test_run_day_with_example_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test solving both parts of a puzzle for a given input file."""
+    monkeypatch.setenv("AOC_NO_CACHE", "1")
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n")
+
+    results = run_day(2024, 1, input_path)
+    assert [result.solution for result in results] == [11, 31]
+    assert all(result.parse_time >= 0 for result in results)
+    assert all(result.wall_time >= 0 for result in results)
+    assert all(result.cpu_time >= 0 for result in results)
+
+
+def test_main_with_single_part(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test running a single part from the command line."""
+    monkeypatch.setenv("AOC_NO_CACHE", "1")
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("190: 10 19\n3267: 81 40 27\n83: 17 5\n")
+
+    main(["2024", "7", "--input", str(input_path), "--part", "1"])
+    output = capsys.readouterr().out
+    assert "Part 1: 3457" in output
+    assert "Part 2" not in output
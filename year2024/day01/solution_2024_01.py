@@ -1,5 +1,7 @@
 from collections import Counter
-from pathlib import Path
+
+from utils.cache import cached_parser
+from utils.parse import read_integers_from_file
 
 
 def calculate_total_distance(left_list: list[int], right_list: list[int]) -> int:
@@ -52,6 +54,7 @@ def calculate_similarity_score(left_list: list[int], right_list: list[int]) -> i
     return sum(num * frequency_table.get(num, 0) for num in left_list)
 
 
+@cached_parser(version=1)
 def read_columns(file_path: str) -> tuple[list[int], list[int]]:
     """Read two columns of integers from a file and return them as two separate lists.
 
@@ -68,30 +71,51 @@ def read_columns(file_path: str) -> tuple[list[int], list[int]]:
         ValueError: If a line does not contain two integers.
         ValueError: If a value cannot be converted to an integer.
     """
-    left_list: list[int] = []
-    right_list: list[int] = []
-
-    with Path(file_path).open() as file:
-        for line_number, line in enumerate(file, start=1):
-            stripped_line = line.strip()
-            if line:
-                values = stripped_line.split()
-                if len(values) == 2:  # noqa: PLR2004
-                    try:
-                        left_value = int(values[0])
-                        right_value = int(values[1])
-                        left_list.append(left_value)
-                        right_list.append(right_value)
-                    except ValueError as e:
-                        msg = f"Line {line_number}: {e}"
-                        raise ValueError(msg)  # noqa: B904
-                else:
-                    msg = (
-                        f"Line {line_number}: Expected at two values, got {len(values)}"
-                    )
-                    raise ValueError(msg)
-
-    return left_list, right_list
+    columns = read_integers_from_file(file_path)
+
+    for line_number, number_of_values in enumerate(columns.row_lengths(), start=1):
+        if number_of_values not in (0, 2):
+            msg = f"Line {line_number}: Expected at two values, got {number_of_values}"
+            raise ValueError(msg)
+
+    # Empty lines hold no values, so the columns simply alternate
+    return columns.values[0::2].tolist(), columns.values[1::2].tolist()
+
+
+def parse_input(file_path: str) -> tuple[list[int], list[int]]:
+    """Parse the puzzle input for both parts.
+
+    Args:
+        file_path (str): The puzzle input file
+
+    Returns:
+        tuple[list[int], list[int]]: The left and right columns
+    """
+    return read_columns(file_path)
+
+
+def solve_part1(columns: tuple[list[int], list[int]]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        columns (tuple[list[int], list[int]]): The left and right columns
+
+    Returns:
+        int: The solution for part 1
+    """
+    return calculate_total_distance(*columns)
+
+
+def solve_part2(columns: tuple[list[int], list[int]]) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        columns (tuple[list[int], list[int]]): The left and right columns
+
+    Returns:
+        int: The solution for part 2
+    """
+    return calculate_similarity_score(*columns)
 
 
 def main() -> None:
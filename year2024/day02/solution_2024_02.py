@@ -1,4 +1,5 @@
-from pathlib import Path
+from utils.cache import cached_parser
+from utils.parse import read_integers_from_file
 
 MAX_VALUE_DISTANCE = 3
 
@@ -66,17 +67,46 @@ def filter_safe_reports_with_dampening(reports: list[list[int]]) -> list[list[in
     return [report for report in reports if is_safe_report_with_dampening(report)]
 
 
+@cached_parser(version=1)
 def read_reports(file_path: str) -> list[list[int]]:
     """Read reports from a file and return them as a list of lists of integers."""
-    reports = []
+    return [report for report in read_integers_from_file(file_path) if report]
 
-    with Path(file_path).open(file_path) as file:
-        for line in file:
-            stripped_line = line.strip()
-            if line:
-                reports.append(list(map(int, stripped_line.split())))
 
-    return reports
+def parse_input(file_path: str) -> list[list[int]]:
+    """Parse the puzzle input for both parts.
+
+    Args:
+        file_path (str): The puzzle input file
+
+    Returns:
+        list[list[int]]: The reports
+    """
+    return read_reports(file_path)
+
+
+def solve_part1(reports: list[list[int]]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        reports (list[list[int]]): The reports
+
+    Returns:
+        int: The solution for part 1
+    """
+    return len(filter_safe_reports_without_dampening(reports))
+
+
+def solve_part2(reports: list[list[int]]) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        reports (list[list[int]]): The reports
+
+    Returns:
+        int: The solution for part 2
+    """
+    return len(filter_safe_reports_with_dampening(reports))
 
 
 def main() -> None:
@@ -95,6 +95,42 @@ def get_input(file_path: str) -> str:
         return file.read()
 
 
+def parse_input(file_path: str) -> str:
+    """Parse the puzzle input for both parts.
+
+    Args:
+        file_path (str): The puzzle input file
+
+    Returns:
+        str: The corrupted memory
+    """
+    return get_input(file_path)
+
+
+def solve_part1(memory: str) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        memory (str): The corrupted memory
+
+    Returns:
+        int: The solution for part 1
+    """
+    return sum_mul_instructions(find_all_instructions(memory))
+
+
+def solve_part2(memory: str) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        memory (str): The corrupted memory
+
+    Returns:
+        int: The solution for part 2
+    """
+    return sum_enabled_mul_instructions(find_all_instructions(memory))
+
+
 def main() -> None:
     """Main entry point for the application."""
     memory = get_input("input.txt")
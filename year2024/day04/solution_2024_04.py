@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from utils.grid import ArrayGrid, create_array_grid_from_lines
+
 SEARCH_X_POSITIVE_DIRECTION = 1
 SEARCH_X_NEGATIVE_DIRECTION = -1
 DO_NOT_SEARCH_IN_X_DIRECTION = 0
@@ -142,6 +144,13 @@ def count_number_of_x_mas_occurrences(word_search: list[str], word: str) -> int:
 
     middle_char = word[len(word) // 2]
 
+    # The array grid needs a rectangular puzzle, like one without trailing empty
+    # lines, the loop below handles any other puzzle
+    if len(word) == 3 and len({len(line) for line in word_search}) == 1:  # noqa: PLR2004
+        grid = create_array_grid_from_lines(word_search)
+        if isinstance(grid, ArrayGrid):
+            return count_number_of_x_mas_occurrences_in_grid(grid, word)
+
     total_occurrences = 0
 
     number_of_lines = len(word_search)
@@ -150,7 +159,7 @@ def count_number_of_x_mas_occurrences(word_search: list[str], word: str) -> int:
     for line_index in range(1, number_of_lines - 1):
         for column_index in range(1, number_of_columns - 1):
             if word_search[line_index][column_index] == middle_char:
-                center_character = "A"
+                center_character = middle_char
                 upper_left_character = word_search[line_index - 1][column_index - 1]
                 upper_right_character = word_search[line_index - 1][column_index + 1]
                 bottom_left_character = word_search[line_index + 1][column_index - 1]
@@ -174,6 +183,33 @@ def count_number_of_x_mas_occurrences(word_search: list[str], word: str) -> int:
     return total_occurrences
 
 
+def count_number_of_x_mas_occurrences_in_grid(grid: ArrayGrid, word: str) -> int:
+    """Count the number of X-MAS occurrences using whole-grid array operations.
+
+    Args:
+        grid (ArrayGrid): The puzzle to search in
+        word (str): The three letter word to find the occurrences for
+
+    Returns:
+        int: The number of X-MAS occurrences of the word
+    """
+    first_char, middle_char, last_char = ord(word[0]), word[1], ord(word[2])
+
+    upper_left = grid.shifted((-1, -1))
+    upper_right = grid.shifted((1, -1))
+    bottom_left = grid.shifted((-1, 1))
+    bottom_right = grid.shifted((1, 1))
+
+    first_diagonal = ((upper_left == first_char) & (bottom_right == last_char)) | (
+        (upper_left == last_char) & (bottom_right == first_char)
+    )
+    second_diagonal = ((upper_right == first_char) & (bottom_left == last_char)) | (
+        (upper_right == last_char) & (bottom_left == first_char)
+    )
+
+    return int((grid.mask(middle_char) & first_diagonal & second_diagonal).sum())
+
+
 def get_input(file_path: str) -> list[str]:
     """Read the word search puzzle from file.
 
@@ -188,6 +224,42 @@ def get_input(file_path: str) -> list[str]:
         return [line.rstrip("\n") for line in all_lines]
 
 
+def parse_input(file_path: str) -> list[str]:
+    """Parse the puzzle input for both parts.
+
+    Args:
+        file_path (str): The puzzle input file
+
+    Returns:
+        list[str]: The word search puzzle
+    """
+    return get_input(file_path)
+
+
+def solve_part1(word_search: list[str]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        word_search (list[str]): The word search puzzle
+
+    Returns:
+        int: The solution for part 1
+    """
+    return count_number_of_occurrences(word_search, "XMAS")
+
+
+def solve_part2(word_search: list[str]) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        word_search (list[str]): The word search puzzle
+
+    Returns:
+        int: The solution for part 2
+    """
+    return count_number_of_x_mas_occurrences(word_search, "MAS")
+
+
 def main() -> None:
     """Main entry point for the application."""
     word_search = get_input("input.txt")
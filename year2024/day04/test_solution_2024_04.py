@@ -1,3 +1,5 @@
+import pytest
+
 from year2024.day04.solution_2024_04 import (
     count_number_of_occurrences,
     count_number_of_x_mas_occurrences,
@@ -38,3 +40,16 @@ def test_x_mas_occurrences_in_example() -> None:
         "..........",
     ]
     assert count_number_of_x_mas_occurrences(word_search, test_word) == 9  # noqa: PLR2004
+
+
+def test_x_mas_occurrences_with_and_without_array_grid(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the array grid and the loop agree for any word and puzzle."""
+    word_search = ["X.Z", ".Y.", "X.Z"]
+    assert count_number_of_x_mas_occurrences(word_search, "XYZ") == 1
+    # Rows of another length are left to the loop
+    assert count_number_of_x_mas_occurrences([*word_search, ""], "XYZ") == 1
+
+    monkeypatch.setattr("utils.grid.np", None)
+    assert count_number_of_x_mas_occurrences(word_search, "XYZ") == 1
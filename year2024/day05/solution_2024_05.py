@@ -1,5 +1,95 @@
+from collections.abc import Iterator, Mapping, Sequence
+from heapq import heapify, heappop, heappush
+from itertools import combinations
 from pathlib import Path
 
+from utils.cache import cached_parser
+from utils.parse import IntegerRows, parse_integer_lines, read_integers_from_file
+
+type BeforeRules = Mapping[int, Sequence[int]]
+
+
+class PageRules(Mapping[int, tuple[int, ...]]):
+    """The pages that must come after each page, with an index of ordered pairs.
+
+    Next to the rules per page, the ordering holds every (before, after) pair of
+    pages, so checking if two pages are in the right order is a single set
+    lookup. The rules cannot be changed after creation, so the ordering always
+    matches them.
+    """
+
+    __slots__ = ("_after_pages", "_ordering")
+
+    def __init__(self, before_rules: BeforeRules | None = None) -> None:
+        """Create the rules and their ordering index.
+
+        Args:
+            before_rules (BeforeRules | None): The pages that must come after
+                each page
+        """
+        self._after_pages = {
+            page: tuple(after_pages)
+            for page, after_pages in (before_rules or {}).items()
+        }
+        self._ordering = frozenset(get_ordering(self._after_pages))
+
+    @property
+    def ordering(self) -> frozenset[tuple[int, int]]:
+        """The (before, after) pairs of pages that are ordered by the rules."""
+        return self._ordering
+
+    def __getitem__(self, page: int) -> tuple[int, ...]:
+        """Get the pages that must come after a page.
+
+        Args:
+            page (int): The page to get the rules for
+
+        Returns:
+            tuple[int, ...]: The pages that must come after the page
+
+        Raises:
+            KeyError: If there are no rules for the page
+        """
+        return self._after_pages[page]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the pages that have rules.
+
+        Returns:
+            Iterator[int]: The pages that must come before other pages
+        """
+        return iter(self._after_pages)
+
+    def __len__(self) -> int:
+        """Get the number of pages that have rules.
+
+        Returns:
+            int: The number of pages that must come before other pages
+        """
+        return len(self._after_pages)
+
+    def __repr__(self) -> str:
+        """Get the representation of the rules.
+
+        Returns:
+            str: The rules per page
+        """
+        return f"PageRules({self._after_pages!r})"
+
+
+def get_ordering(before_rules: BeforeRules) -> set[tuple[int, int]]:
+    """Get all pairs of pages that are ordered by the rules.
+
+    Args:
+        before_rules (BeforeRules): The pages that must come after each page
+
+    Returns:
+        set[tuple[int, int]]: The (before, after) pairs of pages
+    """
+    return {
+        (before, after) for before, afters in before_rules.items() for after in afters
+    }
+
 
 def sum_of_all_middle_values(values: list[list[int]]) -> int:
     """Calculate the sum of all middle values of all given lists.
@@ -13,56 +103,61 @@ def sum_of_all_middle_values(values: list[list[int]]) -> int:
     return sum(sublist[len(sublist) // 2] for sublist in values)
 
 
-def get_all_lines_from_file(file_path: str) -> list[str]:
-    """Read all lines from a given file.
+def get_rules_from_lines(
+    rule_lines: list[str],
+) -> PageRules:
+    """Determine the page rules from the given line definitions.
 
     Args:
-        file_path (str): The file to read the lines from
+        rule_lines (list[str]): A list representing th erules
 
     Returns:
-        list[str]: All read lines
+        PageRules: The rules per page
     """
-    with Path(file_path).open() as file:
-        all_lines = file.readlines()
-        return [line.rstrip() for line in all_lines]
+    return get_rules_from_rows(parse_integer_lines(rule_lines, "|"))
 
 
-def get_rules_from_lines(
-    rule_lines: list[str],
-) -> dict[int, list[int]]:
-    """Determine the page rules from the given line definitions.
+def get_rules_from_rows(rule_rows: IntegerRows) -> PageRules:
+    """Determine the page rules from the parsed page pairs.
 
     Args:
-        rule_lines (list[str]): A list representing th erules
+        rule_rows (IntegerRows): The page pairs, one rule per row
 
     Returns:
-        dict[int, list[int]]: The rules per page
+        PageRules: The rules per page
+
+    Raises:
+        ValueError: If a rule does not consist of two pages
     """
-    before_rules: dict[int, list[int]] = {}
+    for line_number, number_of_pages in enumerate(rule_rows.row_lengths(), start=1):
+        if number_of_pages not in (0, 2):
+            msg = f"Line {line_number}: Expected two pages, got {number_of_pages}"
+            raise ValueError(msg)
 
-    for rule_line in rule_lines:
-        page1, page2 = map(int, rule_line.split("|"))
+    before_rules: dict[int, list[int]] = {}
 
+    pages = rule_rows.values.tolist()
+    for page1, page2 in zip(pages[0::2], pages[1::2], strict=True):
         if page1 not in before_rules:
             before_rules[page1] = []
         before_rules[page1].append(page2)
 
-    return before_rules
+    return PageRules(before_rules)
 
 
+@cached_parser(version=3)
 def get_rules_from_file(
     file_path: str,
-) -> dict[int, list[int]]:
+) -> PageRules:
     """Determine the page rules from the given file.
 
     Args:
         file_path (str): The file to load the rules from
 
     Returns:
-        dict[int, list[int]]: The rules per page
+        PageRules: The rules per page
     """
-    rule_lines = get_all_lines_from_file(file_path)
-    return get_rules_from_lines(rule_lines)
+    return get_rules_from_rows(read_integers_from_file(file_path, "|"))
 
 
 def get_updates_from_lines(update_lines: list[str]) -> list[list[int]]:
@@ -74,9 +169,10 @@ def get_updates_from_lines(update_lines: list[str]) -> list[list[int]]:
     Returns:
         list[list[int]]: The numeric representation of the updates to validate
     """
-    return [list(map(int, update_line.split(","))) for update_line in update_lines]
+    return [update for update in parse_integer_lines(update_lines, ",") if update]
 
 
+@cached_parser(version=1)
 def get_updates_from_file(file_path: str) -> list[list[int]]:
     """Get the updates to validate from file.
 
@@ -86,23 +182,26 @@ def get_updates_from_file(file_path: str) -> list[list[int]]:
     Returns:
         list[list[int]]: The numeric representation of the updates to validate
     """
-    update_lines = get_all_lines_from_file(file_path)
-    return get_updates_from_lines(update_lines)
+    return [update for update in read_integers_from_file(file_path, ",") if update]
 
 
 def get_valid_and_invalid_updates(
     updates: list[list[int]],
-    before_rules: dict[int, list[int]],
+    before_rules: BeforeRules,
 ) -> tuple[list[list[int]], list[list[int]]]:
     """Get the valid and invalid updates.
 
     Args:
         updates (list[list[int]]): The updates to validate
-        before_rules (dict[int, list[int]]): The rules to validate for
+        before_rules (BeforeRules): The rules to validate for
 
     Returns:
         tuple[list[list[int]], list[list[int]]]: The valid and invalid updates
     """
+    if not isinstance(before_rules, PageRules):
+        # Build the ordering index once for all updates
+        before_rules = PageRules(before_rules)
+
     valid_updates: list[list[int]] = []
     invalid_updates: list[list[int]] = []
 
@@ -117,72 +216,181 @@ def get_valid_and_invalid_updates(
 
 
 def get_corrected_updates(
-    invalid_updates: list[list[int]], before_rules: dict[int, list[int]]
+    invalid_updates: list[list[int]], before_rules: BeforeRules
 ) -> list[list[int]]:
     """Correct the given updates.
 
     Args:
         invalid_updates (list[list[int]]): The updates to correct
-        before_rules (dict[int, list[int]]): The rule to validate an update
+        before_rules (BeforeRules): The rule to validate an update
 
     Returns:
         list[list[int]]: The corrected updates
-    """
-    corrected_updates: list[list[int]] = []
-
-    for invalid_update in invalid_updates:
-        corrected_update: list[int] = []
 
-        for current_page in invalid_update:
-            index: list[int] = []
-            before_rules_for_page = before_rules.get(current_page, [])
+    Raises:
+        ValueError: If the rules for the pages of an update form a cycle
+    """
+    return [
+        correct_update(invalid_update, before_rules)
+        for invalid_update in invalid_updates
+    ]
 
-            for required_after in before_rules_for_page:
-                if required_after in corrected_update:
-                    index_of_page_required_after = corrected_update.index(
-                        required_after
-                    )
-                    index.append(index_of_page_required_after)
 
-            if index:
-                corrected_update.insert(min(index), current_page)
-            else:
-                corrected_update.append(current_page)
+def correct_update(update: list[int], before_rules: BeforeRules) -> list[int]:
+    """Put the pages of an update in the order required by the rules.
 
-        corrected_updates.append(corrected_update)
+    The pages are sorted topologically, using only the rules between pages of
+    the update. Whenever several pages are free to go next, the one that came
+    first in the update goes first, so pages the rules do not order keep their
+    original order.
 
-    return corrected_updates
+    Args:
+        update (list[int]): The update to correct
+        before_rules (BeforeRules): The rules to order the pages by
 
+    Returns:
+        list[int]: The pages of the update in the required order
 
-def is_valid_update(update: list[int], before_rules: dict[int, list[int]]) -> bool:
+    Raises:
+        ValueError: If the rules for the pages of the update form a cycle
+    """
+    page_indexes = {page: index for index, page in enumerate(update)}
+    following_indexes: list[list[int]] = [[] for _ in update]
+    preceding_counts = [0] * len(update)
+
+    for index, page in enumerate(update):
+        for following_page in before_rules.get(page, []):
+            following_index = page_indexes.get(following_page)
+            # A page cannot be ordered relative to itself, so skip such rules
+            if following_index is not None and following_index != index:
+                following_indexes[index].append(following_index)
+                preceding_counts[following_index] += 1
+
+    ready_indexes = [
+        index for index, count in enumerate(preceding_counts) if count == 0
+    ]
+    heapify(ready_indexes)
+
+    corrected_update: list[int] = []
+    while ready_indexes:
+        index = heappop(ready_indexes)
+        corrected_update.append(update[index])
+
+        for following_index in following_indexes[index]:
+            preceding_counts[following_index] -= 1
+            if preceding_counts[following_index] == 0:
+                heappush(ready_indexes, following_index)
+
+    if len(corrected_update) != len(update):
+        cycle = _find_cycle(following_indexes, preceding_counts)
+        msg = f"The rules for pages {[update[index] for index in cycle]} form a cycle"
+        raise ValueError(msg)
+
+    return corrected_update
+
+
+def _find_cycle(
+    following_indexes: list[list[int]], preceding_counts: list[int]
+) -> list[int]:
+    # The pages left over by the topological sort are the ones with preceding
+    # pages, which are left over as well. So walking back from any of them over
+    # the left over pages must run into a page again, which closes the cycle.
+    left_over = {index for index, count in enumerate(preceding_counts) if count > 0}
+    preceding_index: dict[int, int] = {}
+    for index in left_over:
+        for following_index in following_indexes[index]:
+            if following_index in left_over:
+                preceding_index[following_index] = index
+
+    path_positions: dict[int, int] = {}
+    index = min(left_over)
+    while index not in path_positions:
+        path_positions[index] = len(path_positions)
+        index = preceding_index[index]
+
+    # The path was walked backward, turn the cycle around to follow the rules
+    cycle = [
+        path_index
+        for path_index, position in path_positions.items()
+        if position >= path_positions[index]
+    ][::-1]
+    # Start with the page that comes first in the update
+    first = cycle.index(min(cycle))
+    return cycle[first:] + cycle[:first]
+
+
+def is_valid_update(update: list[int], before_rules: BeforeRules) -> bool:
     """Determine if an update is valid.
 
+    Every pair of pages in the update is checked against the ordering index of
+    the rules, so each check is a single set lookup. The rules need not be
+    transitive, so checking only adjacent pages would not be enough.
+
     Args:
         update (list[int]): The update to validate
-        before_rules (dict[int, list[int]]): The rules to validate against
+        before_rules (BeforeRules): The rules to validate against, the
+            ordering index is built when these are not PageRules
 
     Returns:
         bool: True if an update adheres to the rules
     """
-    for page_index, page_number in enumerate(update):
-        if page_number in before_rules:
-            must_be_before_pages = before_rules[page_number]
-
-            pages_preceding = update[:page_index]
-            if any(
-                page_preceding in must_be_before_pages
-                for page_preceding in pages_preceding
-            ):
-                return False
-
-        pages_following = update[page_index + 1 :]
-        for page_following in pages_following:
-            if page_following in before_rules:
-                following_page_before_rule = before_rules[page_following]
-                if page_number in following_page_before_rule:
-                    return False
-
-    return True
+    ordering = (
+        before_rules.ordering
+        if isinstance(before_rules, PageRules)
+        else get_ordering(before_rules)
+    )
+
+    return not any(
+        (later_page, earlier_page) in ordering
+        for earlier_page, later_page in combinations(update, 2)
+    )
+
+
+def parse_input(file_path: str) -> tuple[PageRules, list[list[int]]]:
+    """Parse the puzzle input for both parts.
+
+    The rules are read from rules.txt next to the given updates file.
+
+    Args:
+        file_path (str): The puzzle input file with the updates
+
+    Returns:
+        tuple[PageRules, list[list[int]]]: The rules and the updates
+    """
+    rules_file_path = Path(file_path).with_name("rules.txt")
+    return get_rules_from_file(str(rules_file_path)), get_updates_from_file(file_path)
+
+
+def solve_part1(rules_and_updates: tuple[PageRules, list[list[int]]]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        rules_and_updates (tuple[PageRules, list[list[int]]]):
+            The rules and the updates
+
+    Returns:
+        int: The solution for part 1
+    """
+    before_rules, updates = rules_and_updates
+    valid_updates, _ = get_valid_and_invalid_updates(updates, before_rules)
+    return sum_of_all_middle_values(valid_updates)
+
+
+def solve_part2(rules_and_updates: tuple[PageRules, list[list[int]]]) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        rules_and_updates (tuple[PageRules, list[list[int]]]):
+            The rules and the updates
+
+    Returns:
+        int: The solution for part 2
+    """
+    before_rules, updates = rules_and_updates
+    _, invalid_updates = get_valid_and_invalid_updates(updates, before_rules)
+    return sum_of_all_middle_values(
+        get_corrected_updates(invalid_updates, before_rules)
+    )
 
 
 def main() -> None:
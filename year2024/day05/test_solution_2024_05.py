@@ -1,8 +1,15 @@
+import pickle
+
+import pytest
+
 from year2024.day05.solution_2024_05 import (
+    PageRules,
+    correct_update,
     get_corrected_updates,
     get_rules_from_lines,
     get_updates_from_lines,
     get_valid_and_invalid_updates,
+    is_valid_update,
     sum_of_all_middle_values,
 )
 
@@ -47,7 +54,7 @@ def test_get_rules_from_lines() -> None:
         "03|04",
         "04|05",
     ]
-    expected_before_rules = {1: [5, 2], 2: [4, 3], 3: [3, 4], 4: [2, 5], 5: [1]}
+    expected_before_rules = {1: (5, 2), 2: (4, 3), 3: (3, 4), 4: (2, 5), 5: (1,)}
     before_rules = get_rules_from_lines(test_lines)
     assert before_rules == expected_before_rules
 
@@ -143,3 +150,79 @@ def test_update_correction() -> None:
         get_corrected_updates(test_invalid_updates, test_before_rules)
         == expected_corrected_rules
     )
+
+
+def test_rules_ordering_index() -> None:
+    """Test the ordering index built along with the rules."""
+    before_rules = get_rules_from_lines(["47|53", "97|13", "97|47"])
+    assert isinstance(before_rules, PageRules)
+    assert before_rules.ordering == {(47, 53), (97, 13), (97, 47)}
+
+    unpickled_rules = pickle.loads(pickle.dumps(before_rules))  # noqa: S301
+    assert unpickled_rules == before_rules
+    assert unpickled_rules.ordering == before_rules.ordering
+
+
+def test_rules_cannot_get_out_of_sync_with_their_index() -> None:
+    """Test that the rules cannot be changed once the ordering index is built."""
+    before_rules = get_rules_from_lines(["1|2"])
+    with pytest.raises(TypeError):
+        before_rules[3] = [1]
+    with pytest.raises(AttributeError):
+        before_rules[1].append(3)
+
+    rules_with_new_page = PageRules({**before_rules, 3: [1]})
+    assert not is_valid_update([1, 3], rules_with_new_page)
+    assert not is_valid_update([1, 3], dict(rules_with_new_page))
+
+
+def test_is_valid_update_with_many_pages() -> None:
+    """Test validating long updates, against rules with and without an index."""
+    pages = list(range(500))
+    before_rules = {page: pages[page + 1 :] for page in pages}
+    swapped_pages = [
+        *pages[:100],
+        pages[400],
+        *pages[101:400],
+        pages[100],
+        *pages[401:],
+    ]
+
+    for rules in (before_rules, PageRules(before_rules)):
+        assert is_valid_update(pages, rules)
+        assert not is_valid_update(swapped_pages, rules)
+        assert is_valid_update([3, 1_000, 7], rules)
+
+
+def test_correct_update_keeps_unordered_pages_in_place() -> None:
+    """Test that pages without rules between them keep their original order."""
+    before_rules = {1: [2], 5: [4]}
+    assert correct_update([4, 2, 3, 1, 5], before_rules) == [3, 1, 2, 5, 4]
+    assert correct_update([3, 1, 2], before_rules) == [3, 1, 2]
+
+
+def test_correct_update_with_many_pages() -> None:
+    """Test correcting a long update, against rules with and without an index."""
+    pages = list(range(5000))
+    before_rules = {page: [page + 1] for page in pages}
+    shuffled_pages = pages[1::2] + pages[-2::-2]
+
+    for rules in (before_rules, PageRules(before_rules)):
+        assert correct_update(shuffled_pages, rules) == pages
+
+
+def test_correct_update_with_cyclic_rules() -> None:
+    """Test that cyclic rules between the pages of an update are reported."""
+    before_rules = {1: [2], 2: [3], 3: [1], 4: [1]}
+    with pytest.raises(ValueError, match=r"pages \[3, 1, 2\] form a cycle"):
+        correct_update([4, 3, 1, 2], before_rules)
+
+    # The cycle only matters when all of its pages are part of the update
+    assert correct_update([2, 1, 4], before_rules) == [4, 1, 2]
+
+    # Pages that only follow the cycle are not part of it
+    before_rules = {1: [2], 2: [1, 3]}
+    with pytest.raises(ValueError, match=r"pages \[1, 2\] form a cycle"):
+        correct_update([1, 2, 3], before_rules)
+    with pytest.raises(ValueError, match=r"pages \[2, 1\] form a cycle"):
+        correct_update([3, 2, 1], before_rules)
@@ -1,10 +1,23 @@
-from itertools import cycle
-from pathlib import Path
-
-from utils.grid import Grid, Point, create_grid_from_lines, find_first_point_for_value
+from collections.abc import Iterable, Iterator
+from itertools import batched
+from typing import NamedTuple
+
+from utils.grid import (
+    BlockerJumpTable,
+    DenseGrid,
+    Point,
+    StateTracker,
+    find_first_point_for_value,
+    load_grid_from_file,
+)
+from utils.pool import BATCHES_PER_WORKER, run_in_process_pool
 
 type DirectionDelta = tuple[int, int]
 type DirectionDeltas = list[DirectionDelta]
+type GuardState = tuple[Point, int]
+
+# The directions the guard can face, each one a right turn from the previous one
+DIRECTION_DELTAS: DirectionDeltas = [(0, -1), (1, 0), (0, 1), (-1, 0)]
 
 
 def add_delta_to_point(point: Point, delta: Point) -> Point:
@@ -20,38 +33,30 @@ def add_delta_to_point(point: Point, delta: Point) -> Point:
     return point[0] + delta[0], point[1] + delta[1]
 
 
-def find_exit_path(lab_grid: Grid) -> tuple[bool, set[Point]]:
+def find_exit_path(
+    lab_grid: DenseGrid, state_tracker: StateTracker | None = None
+) -> tuple[bool, set[Point]]:
     """Find a possible exit path.
 
     Args:
-        lab_grid (Grid): The grid to find the exit from
+        lab_grid (DenseGrid): The grid to find the exit from
+        state_tracker (StateTracker | None): A tracker for the lab to reuse for
+            the visited locations and directions, a new one when not given
 
     Returns:
         tuple[bool, set[Point]]: True and the path when exited,
           False and an empty set otherwise
     """
-    up_delta = (0, -1)
-    down_delta = (0, 1)
-    left_delta = (-1, 0)
-    right_delta = (1, 0)
-
-    possible_direction_deltas: cycle[DirectionDelta] = cycle(
-        [
-            up_delta,
-            right_delta,
-            down_delta,
-            left_delta,
-        ]
-    )
-
-    current_direction_delta = next(possible_direction_deltas)
+    if state_tracker is None:
+        state_tracker = StateTracker(lab_grid.width, lab_grid.height)
+    state_tracker.reset()
 
     current_location = find_first_point_for_value(lab_grid, "^")
     assert current_location is not None
 
-    visited_locations_from_direction: set[tuple[Point, DirectionDelta]] = {
-        (current_location, current_direction_delta)
-    }
+    direction_index = 0
+    current_direction_delta = DIRECTION_DELTAS[direction_index]
+    state_tracker.visit(current_location, direction_index)
 
     while True:
         next_location = add_delta_to_point(current_location, current_direction_delta)
@@ -60,60 +65,413 @@ def find_exit_path(lab_grid: Grid) -> tuple[bool, set[Point]]:
             break
 
         if lab_grid[next_location] == "#":
-            current_direction_delta = next(possible_direction_deltas)
-            visited_locations_from_direction.add(
-                (current_location, current_direction_delta)
-            )
+            direction_index = (direction_index + 1) % len(DIRECTION_DELTAS)
+            current_direction_delta = DIRECTION_DELTAS[direction_index]
+            if state_tracker.visit(current_location, direction_index):
+                # Turned here to this direction before, like when boxed in
+                return False, set()
             continue
 
-        if (next_location, current_direction_delta) in visited_locations_from_direction:
+        if state_tracker.visit(next_location, direction_index):
             # Been here before from the same direction, so stuck in a loop
             return False, set()
 
-        visited_locations_from_direction.add((next_location, current_direction_delta))
         current_location = next_location
 
-    return True, {location for location, _ in visited_locations_from_direction}
+    return True, state_tracker.visited_points()
+
+
+class GuardStep(NamedTuple):
+    """A state of the guard while walking through the lab."""
+
+    location: Point
+    direction_index: int
+    is_loop: bool = False
+
+
+def walk_guard(
+    lab_grid: DenseGrid,
+    jump_table: BlockerJumpTable | None = None,
+    start_state: GuardState | None = None,
+    state_tracker: StateTracker | None = None,
+) -> Iterator[GuardStep]:
+    """Walk the guard through the lab, one state at a time.
+
+    The guard jumps from obstacle to obstacle using the jump table, but the
+    states in between are still yielded one by one: the start state, every step
+    forward and every turn. Nothing is built up along the way, so callers can
+    stop early or process a path of any length in constant memory. Only the
+    states in which the guard turns are remembered, as running into the same
+    obstacle from the same direction again means the guard is stuck in a loop.
+    The turn that repeats an earlier one is yielded with is_loop set, after
+    which the walk ends.
+
+    Args:
+        lab_grid (DenseGrid): The grid to walk through
+        jump_table (BlockerJumpTable | None): The obstacle jump table for the
+            grid, built from the grid when not given
+        start_state (GuardState | None): The location of the guard and the index
+            of the direction it faces in DIRECTION_DELTAS, defaults to the guard
+            facing up from the ^ location
+        state_tracker (StateTracker | None): A tracker for the lab to reuse for
+            the turns, a new one when not given
+
+    Yields:
+        GuardStep: The next state of the guard
+    """
+    if jump_table is None:
+        jump_table = BlockerJumpTable(lab_grid, "#")
+    if state_tracker is None:
+        state_tracker = StateTracker(lab_grid.width, lab_grid.height)
+    state_tracker.reset()
+
+    if start_state is None:
+        start_location = find_first_point_for_value(lab_grid, "^")
+        assert start_location is not None
+        start_state = (start_location, 0)
+
+    (column, row), direction_index = start_state
+    yield GuardStep((column, row), direction_index)
+
+    while True:
+        delta_column, delta_row = DIRECTION_DELTAS[direction_index]
+        obstacle = jump_table.next_blocker((column, row), (delta_column, delta_row))
+        if obstacle is not None:
+            distance = abs(obstacle[0] - column) + abs(obstacle[1] - row) - 1
+        elif delta_column != 0:
+            distance = lab_grid.width - 1 - column if delta_column > 0 else column
+        else:
+            distance = lab_grid.height - 1 - row if delta_row > 0 else row
+
+        for _ in range(distance):
+            column += delta_column
+            row += delta_row
+            yield GuardStep((column, row), direction_index)
+
+        if obstacle is None:
+            # Moves out of the lab from the edge
+            return
+
+        # Hitting the same obstacle from the same direction means a loop
+        is_loop = state_tracker.visit((column, row), direction_index)
+        direction_index = (direction_index + 1) % len(DIRECTION_DELTAS)
+        yield GuardStep((column, row), direction_index, is_loop)
+        if is_loop:
+            return
+
+
+def find_exit_path_by_turns(
+    lab_grid: DenseGrid, jump_table: BlockerJumpTable | None = None
+) -> tuple[bool, set[Point]]:
+    """Find a possible exit path, jumping from turn to turn.
+
+    This gives the same result as find_exit_path, but is built on walk_guard,
+    which only checks for loops when the guard turns.
+
+    Args:
+        lab_grid (DenseGrid): The grid to find the exit from
+        jump_table (BlockerJumpTable | None): The obstacle jump table for the
+            grid, built from the grid when not given
+
+    Returns:
+        tuple[bool, set[Point]]: True and the path when exited,
+          False and an empty set otherwise
+    """
+    visited_locations: set[Point] = set()
+    for guard_step in walk_guard(lab_grid, jump_table):
+        if guard_step.is_loop:
+            return False, set()
+        visited_locations.add(guard_step.location)
+
+    return True, visited_locations
+
+
+class TurnStateGraph:
+    """The states in which the guard turns, each linked to the next one.
+
+    A turn state is the location of the guard together with the direction it
+    faces while an obstacle blocks its way. After turning right the guard walks
+    straight until the next obstacle, so every turn state has a single successor
+    turn state, or none when the guard leaves the lab. The successors of all
+    states in front of an obstacle are computed up front, others only once they
+    are needed.
+
+    An added obstacle only changes the successor of the states whose next
+    straight walk crosses it, so whether it gets the guard stuck in a loop is
+    found by following the graph while checking each walk against the added
+    obstacle, instead of walking the lab again.
+    """
+
+    __slots__ = ("_jump_table", "_successors")
+
+    def __init__(self, lab_grid: DenseGrid, jump_table: BlockerJumpTable) -> None:
+        """Build the turn states in front of all obstacles of a lab.
+
+        Args:
+            lab_grid (DenseGrid): A grid describing the lab
+            jump_table (BlockerJumpTable): The obstacle jump table for the lab
+        """
+        self._jump_table = jump_table
+        self._successors: dict[GuardState, GuardState | None] = {}
+
+        for obstacle in lab_grid.points_for_value("#"):
+            for direction_index, (delta_column, delta_row) in enumerate(
+                DIRECTION_DELTAS
+            ):
+                location = obstacle[0] - delta_column, obstacle[1] - delta_row
+                if location in lab_grid and not jump_table.is_blocker(location):
+                    self.get_successor((location, direction_index))
+
+    def get_successor(self, turn_state: GuardState) -> GuardState | None:
+        """Get the next turn state after turning in a given turn state.
+
+        Args:
+            turn_state (GuardState): The location of the guard and the index of
+                the direction it faces in DIRECTION_DELTAS while blocked
+
+        Returns:
+            GuardState | None: The next turn state, None when the guard leaves
+                the lab instead
+        """
+        try:
+            return self._successors[turn_state]
+        except KeyError:
+            pass
+
+        location, direction_index = turn_state
+        direction_index = (direction_index + 1) % len(DIRECTION_DELTAS)
+        delta_column, delta_row = DIRECTION_DELTAS[direction_index]
+        obstacle = self._jump_table.next_blocker(location, (delta_column, delta_row))
+
+        successor = (
+            None
+            if obstacle is None
+            else (
+                (obstacle[0] - delta_column, obstacle[1] - delta_row),
+                direction_index,
+            )
+        )
+        self._successors[turn_state] = successor
+        return successor
+
+    def is_loop_with_obstacle(
+        self,
+        start_state: GuardState,
+        obstacle: Point,
+        state_tracker: StateTracker,
+    ) -> bool:
+        """Check if the guard gets stuck in a loop after adding an obstacle.
+
+        Args:
+            start_state (GuardState): The location of the guard and the index of
+                the direction it faces, right in front of the added obstacle
+            obstacle (Point): The added obstacle
+            state_tracker (StateTracker): A tracker for the lab to reuse for the
+                turns
+
+        Returns:
+            bool: True if the guard gets stuck in a loop
+        """
+        state_tracker.reset()
+        obstacle_column, obstacle_row = obstacle
+
+        turn_state: GuardState | None = start_state
+        while turn_state is not None:
+            location, direction_index = turn_state
+            if state_tracker.visit(location, direction_index):
+                return True
+
+            successor = self.get_successor(turn_state)
+
+            column, row = location
+            if column != obstacle_column and row != obstacle_row:
+                # The added obstacle is not in line with this walk
+                turn_state = successor
+                continue
+
+            # Check if the added obstacle is hit before the next obstacle
+            direction_index = (direction_index + 1) % len(DIRECTION_DELTAS)
+            delta_column, delta_row = DIRECTION_DELTAS[direction_index]
+            offset_column, offset_row = obstacle_column - column, obstacle_row - row
+            distance = offset_column * delta_column + offset_row * delta_row
+            if (
+                distance > 0
+                and (offset_column, offset_row)
+                == (distance * delta_column, distance * delta_row)
+                and (
+                    successor is None
+                    or distance
+                    <= abs(successor[0][0] - column) + abs(successor[0][1] - row)
+                )
+            ):
+                successor = (
+                    (obstacle_column - delta_column, obstacle_row - delta_row),
+                    direction_index,
+                )
+
+            turn_state = successor
+
+        return False
+
+
+def get_obstacle_candidates(
+    guard_steps: Iterable[GuardStep],
+) -> list[tuple[GuardState, Point]]:
+    """Get the locations where an added obstacle could change the path.
+
+    Only the first time the guard reaches a location matters, as the guard would
+    have hit an obstacle there already before any later visit.
+
+    Args:
+        guard_steps (Iterable[GuardStep]): The states of the guard along the
+            exit path
+
+    Returns:
+        list[tuple[GuardState, Point]]: The state of the guard just before it
+            first reaches each candidate location, with the candidate location
+    """
+    candidates: list[tuple[GuardState, Point]] = []
+    guard_steps = iter(guard_steps)
+    previous_location, _, _ = next(guard_steps)
+    checked_locations = {previous_location}
+    for location, direction_index, _ in guard_steps:
+        if location not in checked_locations:
+            checked_locations.add(location)
+            candidates.append(((previous_location, direction_index), location))
 
+        previous_location = location
 
-def prevent_guard_from_moving_out(lab_grid: Grid) -> int:
+    return candidates
+
+
+def count_loops_for_candidates(
+    turn_state_graph: TurnStateGraph,
+    candidates: list[tuple[GuardState, Point]],
+    state_tracker: StateTracker,
+) -> int:
+    """Count the candidate obstacles that get the guard stuck in a loop.
+
+    Args:
+        turn_state_graph (TurnStateGraph): The turn states of the lab
+        candidates (list[tuple[GuardState, Point]]): The state of the guard just
+            before it reaches each candidate location, with the candidate location
+        state_tracker (StateTracker): A tracker for the lab to reuse for the
+            turns
+
+    Returns:
+        int: The number of candidates that lead to a loop
+    """
+    return sum(
+        turn_state_graph.is_loop_with_obstacle(
+            guard_state, obstacle_location, state_tracker
+        )
+        for guard_state, obstacle_location in candidates
+    )
+
+
+# The turn state graph and tracker shared with the worker processes, set once per
+# worker
+_worker_state: tuple[TurnStateGraph, StateTracker]
+
+
+def _initialize_worker(
+    turn_state_graph: TurnStateGraph, state_tracker: StateTracker
+) -> None:
+    global _worker_state  # noqa: PLW0603
+    _worker_state = (turn_state_graph, state_tracker)
+
+
+def _count_loops_in_worker(candidates: list[tuple[GuardState, Point]]) -> int:
+    turn_state_graph, state_tracker = _worker_state
+    return count_loops_for_candidates(turn_state_graph, candidates, state_tracker)
+
+
+def prevent_guard_from_moving_out(lab_grid: DenseGrid, workers: int = 1) -> int:
     """Prevent the guard from moving out of the lab by adding obstacles.
 
+    An obstacle can only change the path when placed on it, and only from the
+    first time the guard would reach it. So rather than walking from the start
+    again, every candidate is checked by resuming the walk from the state of the
+    guard on the original path just before it first reaches the candidate.
+
+    Every candidate is checked by following the turn state graph of the lab
+    with the candidate as an extra obstacle, so the checks are independent and
+    can be spread over worker processes, each with its own copy of the graph.
+
     Args:
-        lab_grid (Grid): A grid describing the lab
+        lab_grid (DenseGrid): A grid describing the lab
+        workers (int): The number of worker processes, 1 checks all candidates
+            in this process
 
     Returns:
         int: The number of obstacles added
     """
-    exited, succesful_exit_path = find_exit_path(lab_grid)
-    assert exited
+    jump_table = BlockerJumpTable(lab_grid, "#")
+
+    candidates = get_obstacle_candidates(walk_guard(lab_grid, jump_table))
+    turn_state_graph = TurnStateGraph(lab_grid, jump_table)
+    state_tracker = StateTracker(lab_grid.width, lab_grid.height)
+    if workers <= 1:
+        return count_loops_for_candidates(turn_state_graph, candidates, state_tracker)
+
+    batch_size = max(len(candidates) // (workers * BATCHES_PER_WORKER), 1)
+    batches = [list(batch) for batch in batched(candidates, batch_size, strict=False)]
+
+    return sum(
+        run_in_process_pool(
+            _initialize_worker,
+            (turn_state_graph, state_tracker),
+            _count_loops_in_worker,
+            batches,
+            workers,
+        )
+    )
+
+
+def parse_input(file_path: str) -> DenseGrid:
+    """Parse the puzzle input for both parts.
+
+    Args:
+        file_path (str): The puzzle input file
+
+    Returns:
+        DenseGrid: The lab grid
+    """
+    return load_grid_from_file(file_path)
 
-    possible_obstacle_locations = 0
-    for current_location in succesful_exit_path:
-        if lab_grid[current_location] == "^":
-            continue
 
-        lab_grid[current_location] = "#"
-        exited, _ = find_exit_path(lab_grid)
-        if not exited:
-            possible_obstacle_locations += 1
+def solve_part1(lab_grid: DenseGrid) -> int:
+    """Solve part 1 of the puzzle.
 
-        lab_grid[current_location] = "."
+    Args:
+        lab_grid (DenseGrid): The lab grid
+
+    Returns:
+        int: The solution for part 1
+    """
+    _, path = find_exit_path_by_turns(lab_grid)
+    return len(path)
 
-    return possible_obstacle_locations
+
+def solve_part2(lab_grid: DenseGrid) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        lab_grid (DenseGrid): The lab grid
+
+    Returns:
+        int: The solution for part 2
+    """
+    return prevent_guard_from_moving_out(lab_grid)
 
 
 def main() -> None:
     """Main entry point for the application."""
-    lines: list[str] = []
-    with Path("input.txt").open() as file:
-        lines = [line.rstrip() for line in file]
-
-    lab_grid = create_grid_from_lines(lines)
-    _, path = find_exit_path(lab_grid)
-    print(f"Number of distinct steps: {len(path)}")
+    lab_grid = load_grid_from_file("input.txt")
+    visited_locations = {guard_step.location for guard_step in walk_guard(lab_grid)}
+    print(f"Number of distinct steps: {len(visited_locations)}")
 
-    lab_grid = create_grid_from_lines(lines)
+    lab_grid = load_grid_from_file("input.txt")
     obstacles_added = prevent_guard_from_moving_out(lab_grid)
     print(f"Obstacles added: {obstacles_added}")
 
@@ -1,7 +1,11 @@
-from utils.grid import create_grid_from_lines
+from utils.grid import BlockerJumpTable, StateTracker, create_grid_from_lines
 from year2024.day06.solution_2024_06 import (
+    GuardStep,
+    TurnStateGraph,
     find_exit_path,
+    find_exit_path_by_turns,
     prevent_guard_from_moving_out,
+    walk_guard,
 )
 
 
@@ -41,3 +45,166 @@ def test_example_puzzle_input_for_added_obstacles() -> None:
     ]
     test_lab_grid = create_grid_from_lines(test_lab_layout_str)
     assert prevent_guard_from_moving_out(test_lab_grid) == 6  # noqa: PLR2004
+
+
+def test_example_puzzle_input_for_succesful_exit_by_turns() -> None:
+    """Test that jumping from turn to turn visits the same cells as stepping."""
+    test_lab_layout_str = [
+        "....#.....",
+        ".........#",
+        "..........",
+        "..#.......",
+        ".......#..",
+        "..........",
+        ".#..^.....",
+        "........#.",
+        "#.........",
+        "......#...",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    exited, path = find_exit_path_by_turns(test_lab_grid)
+    assert exited
+    assert path == find_exit_path(test_lab_grid)[1]
+
+
+def test_loop_is_detected_by_turns() -> None:
+    """Test that a guard walking in circles is detected from the turns alone."""
+    test_lab_layout_str = [
+        ".#...",
+        "....#",
+        ".^...",
+        "#....",
+        "...#.",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    assert find_exit_path_by_turns(test_lab_grid) == (False, set())
+    assert find_exit_path(test_lab_grid) == (False, set())
+
+
+def test_boxed_in_guard_is_a_loop() -> None:
+    """Test that a guard that can only turn around in place is stuck."""
+    test_lab_layout_str = [
+        ".#..",
+        "#^#.",
+        ".###",
+        "..#.",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    assert find_exit_path(test_lab_grid) == (False, set())
+    assert find_exit_path_by_turns(test_lab_grid) == (False, set())
+
+
+def test_added_obstacles_match_walking_from_the_start() -> None:
+    """Test that resuming the walk finds the same obstacles as starting over."""
+    test_lab_layout_str = [
+        "..#.......#.",
+        "......#.....",
+        "#...........",
+        ".....#....#.",
+        "..#.........",
+        ".......^..#.",
+        "#...........",
+        "....#....#..",
+        "...........#",
+        ".#....#.....",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    _, path = find_exit_path(test_lab_grid)
+
+    expected_obstacles = 0
+    for location in path:
+        if test_lab_grid[location] == "^":
+            continue
+        test_lab_grid[location] = "#"
+        exited, _ = find_exit_path(test_lab_grid)
+        expected_obstacles += not exited
+        test_lab_grid[location] = "."
+
+    assert prevent_guard_from_moving_out(test_lab_grid) == expected_obstacles
+
+
+def test_example_puzzle_input_for_added_obstacles_with_workers() -> None:
+    """Test that checking the obstacles in worker processes gives the same count."""
+    test_lab_layout_str = [
+        "....#.....",
+        ".........#",
+        "..........",
+        "..#.......",
+        ".......#..",
+        "..........",
+        ".#..^.....",
+        "........#.",
+        "#.........",
+        "......#...",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    assert prevent_guard_from_moving_out(test_lab_grid, workers=2) == 6  # noqa: PLR2004
+
+
+def test_turn_state_graph() -> None:
+    """Test following the turn states with and without an added obstacle."""
+    test_lab_layout_str = [
+        "....#.....",
+        ".........#",
+        "..........",
+        "..#.......",
+        ".......#..",
+        "..........",
+        ".#..^.....",
+        "........#.",
+        "#.........",
+        "......#...",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    turn_state_graph = TurnStateGraph(
+        test_lab_grid, BlockerJumpTable(test_lab_grid, "#")
+    )
+    assert turn_state_graph.get_successor(((4, 1), 0)) == ((8, 1), 1)
+    assert turn_state_graph.get_successor(((8, 1), 1)) == ((8, 6), 2)
+    assert turn_state_graph.get_successor(((7, 7), 1)) is None
+
+    state_tracker = StateTracker(test_lab_grid.width, test_lab_grid.height)
+    assert turn_state_graph.is_loop_with_obstacle(((4, 6), 3), (3, 6), state_tracker)
+    assert not turn_state_graph.is_loop_with_obstacle(
+        ((4, 6), 0), (4, 5), state_tracker
+    )
+
+
+def test_walk_guard() -> None:
+    """Test walking the guard one state at a time."""
+    test_lab_layout_str = [
+        "....#.....",
+        ".........#",
+        "..........",
+        "..#.......",
+        ".......#..",
+        "..........",
+        ".#..^.....",
+        "........#.",
+        "#.........",
+        "......#...",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    guard_steps = walk_guard(test_lab_grid)
+    assert next(guard_steps) == GuardStep((4, 6), 0)
+    assert next(guard_steps) == GuardStep((4, 5), 0)
+
+    guard_steps = list(walk_guard(test_lab_grid))
+    assert not any(guard_step.is_loop for guard_step in guard_steps)
+    assert guard_steps[-1] == GuardStep((7, 9), 2)
+    assert len({guard_step.location for guard_step in guard_steps}) == 41  # noqa: PLR2004
+
+
+def test_walk_guard_marks_loop() -> None:
+    """Test that walking the guard ends with a marked step when stuck in a loop."""
+    test_lab_layout_str = [
+        ".#...",
+        "....#",
+        ".^...",
+        "#....",
+        "...#.",
+    ]
+    test_lab_grid = create_grid_from_lines(test_lab_layout_str)
+    guard_steps = list(walk_guard(test_lab_grid))
+    assert guard_steps[-1] == GuardStep((1, 1), 1, is_loop=True)
+    assert sum(guard_step.is_loop for guard_step in guard_steps) == 1
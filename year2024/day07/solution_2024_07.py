@@ -1,94 +1,672 @@
-from collections.abc import Callable
-from pathlib import Path
-
-OPERATIONS_PART1: list[Callable[[int, int], int]] = [
-    lambda x, y: x + y,  # '+' operator
-    lambda x, y: x * y,  # '*' operator
+import operator
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import batched
+from typing import TYPE_CHECKING, NamedTuple
+
+from utils.cache import cached_parser
+from utils.parse import (
+    INT64_MAX,
+    IntegerRows,
+    parse_integer_lines,
+    read_integers_from_file,
+)
+from utils.pool import BATCHES_PER_WORKER, run_in_process_pool
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+# Every power of ten up to the first one above the largest 64-bit number
+POWERS_OF_TEN: list[int] = [10**exponent for exponent in range(20)]
+
+# The smallest power of ten above each number, for the numbers of up to four
+# digits that make up most of the operands
+_POWER_OF_TEN_LOOKUP_SIZE = 10_000
+_POWERS_OF_TEN_ABOVE: list[int] = [
+    10 ** len(str(number)) for number in range(_POWER_OF_TEN_LOOKUP_SIZE)
 ]
 
-OPERATIONS_PART2: list[Callable[[int, int], int]] = [
-    lambda x, y: x + y,  # '+' operator
-    lambda x, y: x * y,  # '*' operator
-    lambda x, y: int(f"{x}{y}"),  # '||' operator
+
+type ArrayOperation = Callable[
+    [npt.NDArray[np.int64], npt.NDArray[np.int64]], npt.NDArray[np.int64]
 ]
 
+# The number of results the forward search remembers per equation
+DEFAULT_MEMO_SIZE = 4096
+
+# The number of equations of the same length evaluated together with NumPy
+DEFAULT_BATCH_SIZE = 256
+
+
+class Operator(NamedTuple):
+    """An operator that can be applied to two numbers, and undone again.
+
+    An operator is monotonic when, for positive operands, its result is never
+    below the left operand and grows with the left operand. Searches can then
+    drop any branch that already went past the total. Operators that can be
+    applied to whole arrays of 64-bit numbers at once provide apply_to_arrays.
+    """
+
+    symbol: str
+    apply: Callable[[int, int], int]
+    undo: Callable[[int, int], int | None]
+    monotonic: bool = False
+    apply_to_arrays: ArrayOperation | None = None
+
+    def __call__(self, left: int, right: int) -> int:
+        """Apply the operator.
+
+        Args:
+            left (int): The left operand
+            right (int): The right operand
+
+        Returns:
+            int: The result
+        """
+        return self.apply(left, right)
+
+
+def undo_add(result: int, right: int) -> int | None:
+    """Get the left operand of an addition, as long as it is positive.
+
+    Args:
+        result (int): The result of the addition
+        right (int): The right operand
+
+    Returns:
+        int | None: The left operand, None when it would not be positive
+    """
+    left = result - right
+    return left if left > 0 else None
+
+
+def undo_multiply(result: int, right: int) -> int | None:
+    """Get the left operand of a multiplication, as long as it divides exactly.
+
+    Args:
+        result (int): The result of the multiplication
+        right (int): The right operand
+
+    Returns:
+        int | None: The left operand, None when the division is not exact
+    """
+    left, remainder = divmod(result, right)
+    return left if remainder == 0 else None
+
+
+def get_power_of_ten_above(number: int) -> int:
+    """Get the smallest power of ten above a non-negative number.
+
+    This is the factor to shift a number by to make room for the digits of the
+    given number. Small numbers are looked up directly, larger ones are found
+    in a table of powers of ten.
+
+    Args:
+        number (int): The non-negative number
+
+    Returns:
+        int: The smallest power of ten above the number
+    """
+    if 0 <= number < _POWER_OF_TEN_LOOKUP_SIZE:
+        return _POWERS_OF_TEN_ABOVE[number]
+
+    exponent = bisect_right(POWERS_OF_TEN, number)
+    if exponent < len(POWERS_OF_TEN):
+        return POWERS_OF_TEN[exponent]
+
+    return 10 ** len(str(number))
+
+
+def concatenate(left: int, right: int) -> int:
+    """Concatenate the digits of two non-negative numbers.
+
+    Args:
+        left (int): The left operand
+        right (int): The right operand
+
+    Returns:
+        int: The digits of the left operand followed by those of the right one
+    """
+    return left * get_power_of_ten_above(right) + right
+
+
+def concatenate_arrays(
+    left: "npt.NDArray[np.int64]", right: "npt.NDArray[np.int64]"
+) -> "npt.NDArray[np.int64]":
+    """Concatenate the digits of two arrays of non-negative numbers.
+
+    Args:
+        left (npt.NDArray[np.int64]): The left operands
+        right (npt.NDArray[np.int64]): The right operands
+
+    Returns:
+        npt.NDArray[np.int64]: The digits of every left operand followed by those
+            of the right one, which must fit in 64 bits
+    """
+    powers_of_ten = np.array(POWERS_OF_TEN[:-1], dtype=np.int64)
+    shifts = powers_of_ten[np.searchsorted(powers_of_ten, right, side="right")]
+    return left * shifts + right
 
-def try_find_successful_solution(
+
+def undo_concatenate(result: int, right: int) -> int | None:
+    """Get the left operand of a concatenation, as long as it is positive.
+
+    Args:
+        result (int): The result of the concatenation
+        right (int): The right operand
+
+    Returns:
+        int | None: The left operand, None when the result does not end with the
+            digits of the right operand
+    """
+    left, last_digits = divmod(result, get_power_of_ten_above(right))
+    return left if last_digits == right and left > 0 else None
+
+
+ADD = Operator(
+    "+", operator.add, undo_add, monotonic=True, apply_to_arrays=operator.add
+)
+MULTIPLY = Operator(
+    "*", operator.mul, undo_multiply, monotonic=True, apply_to_arrays=operator.mul
+)
+CONCATENATE = Operator(
+    "||",
+    concatenate,
+    undo_concatenate,
+    monotonic=True,
+    apply_to_arrays=concatenate_arrays,
+)
+
+OPERATIONS_PART1: list[Operator] = [ADD, MULTIPLY]
+
+OPERATIONS_PART2: list[Operator] = [ADD, MULTIPLY, CONCATENATE]
+
+
+def get_reachable_range(
+    numbers: Sequence[int], operations: Sequence[Callable[[int, int], int]]
+) -> tuple[int, int]:
+    """Get the smallest and largest result of combining numbers with operations.
+
+    For monotonic operations, the smallest result comes from always picking the
+    operation with the smallest result, and likewise for the largest one.
+
+    Args:
+        numbers (Sequence[int]): The positive numbers to combine
+        operations (Sequence[Callable[[int, int], int]]): The allowed operations,
+            which must all be monotonic
+
+    Returns:
+        tuple[int, int]: The smallest and the largest result
+    """
+    smallest = largest = numbers[0]
+    for number in numbers[1:]:
+        smallest = min(operation(smallest, number) for operation in operations)
+        largest = max(operation(largest, number) for operation in operations)
+
+    return smallest, largest
+
+
+def try_find_successful_solution(  # noqa: PLR0913
     total: int,
-    numbers: list[int],
-    already_known_good_or_bad_totals: dict[tuple[tuple[int, ...], int], bool],
-    operations: list[Callable[[int, int], int]],
+    numbers: Sequence[int],
+    operations: Sequence[Callable[[int, int], int]],
+    memo_size: int | None = DEFAULT_MEMO_SIZE,
+    *,
+    monotonic: bool = False,
+    required_operations: Sequence[Callable[[int, int], int]] = (),
 ) -> int | None:
     """Try to find a succesfull solution recursively.
 
+    The search walks over the numbers by index with the running result so far,
+    so no lists are built along the way. Results are remembered per index and
+    running result, which skips subtrees that were reached before through other
+    operations, like 2 + 2 and 2 * 2.
+
     Args:
         total (int): The total to look for
-        numbers (list[int]): The numbers to try the operations on
-        already_known_good_or_bad_totals (dict[tuple[tuple[int, ...], int], bool]):
-            already known good and bad combinations
-        operations (list[Callable[[int, int], int]]): The allowed operations
+        numbers (Sequence[int]): The numbers to try the operations on
+        operations (Sequence[Callable[[int, int], int]]): The allowed operations
+        memo_size (int | None): The maximum number of remembered results, None
+            for no limit
+        monotonic (bool): All operations are monotonic and all numbers are
+            positive, so the search skips totals outside the reachable range and
+            branches that already went past the total
+        required_operations (Sequence[Callable[[int, int], int]]): Only count
+            solutions that use at least one of these operations, all solutions
+            count when empty
 
     Returns:
         int | None: The found total if possible, None otherwise
     """
-    if len(numbers) == 1:
-        return total if total == numbers[0] else None
+    if monotonic:
+        smallest, largest = get_reachable_range(numbers, operations)
+        if not smallest <= total <= largest:
+            return None
 
-    current_total_and_numbers = (tuple(numbers), total)
-    if current_total_and_numbers in already_known_good_or_bad_totals:
-        return already_known_good_or_bad_totals[current_total_and_numbers]
+    operands = tuple(numbers)
+    last_index = len(operands) - 1
+    operations_and_required = [
+        (operation, operation in required_operations) for operation in operations
+    ]
 
-    first, second = numbers[0], numbers[1]
+    @lru_cache(maxsize=memo_size)
+    def is_solvable(index: int, accumulator: int, used_required: bool) -> bool:  # noqa: FBT001
+        if index == last_index:
+            return used_required and accumulator == total
 
-    for operation in operations:
-        new_numbers: list[int] = [operation(first, second)] + numbers[2:]
+        next_index = index + 1
+        operand = operands[next_index]
+        for operation, is_required in operations_and_required:
+            if next_index == last_index and not (used_required or is_required):
+                # The last chance to use a required operation
+                continue
+
+            result = operation(accumulator, operand)
+            if monotonic and result > total:
+                # The running result can only grow from here
+                continue
+
+            if is_solvable(next_index, result, used_required or is_required):
+                return True
+
+        return False
+
+    return total if is_solvable(0, operands[0], not required_operations) else None
+
+
+def try_find_successful_solution_backward(
+    total: int,
+    numbers: Sequence[int],
+    operations: Sequence[Operator],
+    required_operations: Sequence[Operator] = (),
+) -> int | None:
+    """Try to find a succesfull solution by working back from the total.
+
+    Starting from the total, the last number is taken off by undoing each of
+    the operations, which only works when the result of the undo is a positive
+    number. Most undos fail, like a division that is not exact, so most
+    branches end right away. All numbers must be positive.
+
+    Args:
+        total (int): The total to look for
+        numbers (Sequence[int]): The numbers to try the operations on
+        operations (Sequence[Operator]): The allowed operations
+        required_operations (Sequence[Operator]): Only count solutions that use
+            at least one of these operations, all solutions count when empty
+
+    Returns:
+        int | None: The found total if possible, None otherwise
+    """
+    operands = tuple(numbers)
+    undo_functions_and_required = [
+        (operation.undo, operation in required_operations) for operation in operations
+    ]
+
+    def is_solvable(index: int, remaining_total: int, used_required: bool) -> bool:  # noqa: FBT001
+        if index == 0:
+            return used_required and remaining_total == operands[0]
+
+        operand = operands[index]
+        for undo, is_required in undo_functions_and_required:
+            if index == 1 and not (used_required or is_required):
+                # The last chance to use a required operation
+                continue
+
+            previous_total = undo(remaining_total, operand)
+            if previous_total is not None and is_solvable(
+                index - 1, previous_total, used_required or is_required
+            ):
+                return True
+
+        return False
+
+    return (
+        total
+        if is_solvable(len(operands) - 1, total, not required_operations)
+        else None
+    )
+
+
+def get_apply_functions(
+    operations: Sequence[Callable[[int, int], int]],
+) -> list[Callable[[int, int], int]]:
+    """Get the functions to call for the given operations.
+
+    Operators are replaced by their apply function, so the forward search calls
+    the specialized function directly, other callables are used as they are.
+
+    Args:
+        operations (Sequence[Callable[[int, int], int]]): The allowed operations
+
+    Returns:
+        list[Callable[[int, int], int]]: The functions to call per operation
+    """
+    return [
+        operation.apply if isinstance(operation, Operator) else operation
+        for operation in operations
+    ]
 
-        if try_find_successful_solution(
-            total, new_numbers, already_known_good_or_bad_totals, operations
-        ):
-            already_known_good_or_bad_totals[current_total_and_numbers] = True
-            return total
 
-    already_known_good_or_bad_totals[current_total_and_numbers] = False
+def split_into_balanced_chunks(
+    totals_and_numbers: list[tuple[int, list[int]]],
+    operation_count: int,
+    chunk_count: int,
+) -> list[list[tuple[int, list[int]]]]:
+    """Split equations into chunks that take about as long to solve.
 
-    return None
+    The cost of an equation grows exponentially with its length, as there are
+    operation_count ** (n - 1) ways to combine n numbers. Starting with the most
+    expensive equation, every equation goes to the chunk with the lowest cost so
+    far.
+
+    Args:
+        totals_and_numbers (list[tuple[int, list[int]]]):
+            The list of totals and their possible solution numbers
+        operation_count (int): The number of allowed operations
+        chunk_count (int): The number of chunks to split into
+
+    Returns:
+        list[list[tuple[int, list[int]]]]: The non-empty chunks
+    """
+    chunks: list[list[tuple[int, list[int]]]] = [[] for _ in range(chunk_count)]
+    chunk_costs = [(0, index) for index in range(chunk_count)]
+
+    for total, numbers in sorted(
+        totals_and_numbers, key=lambda equation: len(equation[1]), reverse=True
+    ):
+        cost, index = heappop(chunk_costs)
+        chunks[index].append((total, numbers))
+        heappush(chunk_costs, (cost + operation_count ** (len(numbers) - 1), index))
+
+    return [chunk for chunk in chunks if chunk]
 
 
 def get_sum_total(
     totals_and_numbers: list[tuple[int, list[int]]],
-    operations: list[Callable[[int, int], int]],
+    operations: Sequence[Callable[[int, int], int]],
+    *,
+    backward: bool = False,
+    workers: int = 1,
+    required_operations: Sequence[Callable[[int, int], int]] = (),
 ) -> int:
     """Get the sum total for all valid solutions.
 
+    Every equation is solved on its own, so with more than one worker the
+    equations are split into chunks of about equal cost that are solved in
+    worker processes.
+
     Args:
         totals_and_numbers (list[tuple[int, list[int]]]):
             The list of totals and their possible solution numbers
-        operations (list[Callable[[int, int], int]]): The allowed operations
+        operations (Sequence[Callable[[int, int], int]]): The allowed
+            operations, either Operators or any other function of two numbers
+        backward (bool): Work back from the totals instead of forward from the
+            numbers, equations with numbers below 1 are always solved forward
+        workers (int): The number of worker processes, 1 solves all equations
+            in this process
+        required_operations (Sequence[Callable[[int, int], int]]): Only count
+            solutions that use at least one of these operations, all solutions
+            count when empty
 
     Returns:
         int: The total for all valid solutions
+
+    Raises:
+        ValueError: If working backward with operations that are not Operators
     """
+    if backward and not all(
+        isinstance(operation, Operator) for operation in operations
+    ):
+        msg = "Working backward needs Operators, which can be undone"
+        raise ValueError(msg)
+
+    if workers <= 1:
+        return _sum_valid_totals(
+            totals_and_numbers,
+            operations,
+            backward=backward,
+            required_operations=required_operations,
+        )
+
+    chunks = split_into_balanced_chunks(
+        totals_and_numbers, len(operations), workers * BATCHES_PER_WORKER
+    )
+
+    return sum(
+        run_in_process_pool(
+            _initialize_worker,
+            (operations, backward, required_operations),
+            _sum_valid_totals_in_worker,
+            chunks,
+            workers,
+        )
+    )
+
+
+def get_sum_totals_incrementally(
+    totals_and_numbers: list[tuple[int, list[int]]],
+    *,
+    backward: bool = False,
+    workers: int = 1,
+) -> tuple[int, int]:
+    """Get the sum totals for both parts, reusing the results of part 1.
+
+    The part 2 operations include those of part 1, so every equation that is
+    valid for part 1 is valid for part 2 as well. Part 2 only searches the
+    equations that failed part 1, and only the solutions that use one of the
+    operations added in part 2, as all others already failed.
+
+    Args:
+        totals_and_numbers (list[tuple[int, list[int]]]):
+            The list of totals and their possible solution numbers
+        backward (bool): Work back from the totals instead of forward from the
+            numbers
+        workers (int): The number of worker processes for part 2
+
+    Returns:
+        tuple[int, int]: The total for all valid solutions of part 1 and part 2
+    """
+    failed_equations: list[tuple[int, list[int]]] = []
+    sum_total_part1 = _sum_valid_totals(
+        totals_and_numbers,
+        OPERATIONS_PART1,
+        backward=backward,
+        failed_equations=failed_equations,
+    )
+
+    added_operations = [
+        operation for operation in OPERATIONS_PART2 if operation not in OPERATIONS_PART1
+    ]
+    sum_total_part2 = sum_total_part1 + get_sum_total(
+        failed_equations,
+        OPERATIONS_PART2,
+        backward=backward,
+        workers=workers,
+        required_operations=added_operations,
+    )
+
+    return sum_total_part1, sum_total_part2
+
+
+def _sum_valid_totals(
+    totals_and_numbers: list[tuple[int, list[int]]],
+    operations: Sequence[Callable[[int, int], int]],
+    *,
+    backward: bool,
+    required_operations: Sequence[Callable[[int, int], int]] = (),
+    failed_equations: list[tuple[int, list[int]]] | None = None,
+) -> int:
+    # The equations without a valid solution are added to failed_equations
+    operators = [
+        operation for operation in operations if isinstance(operation, Operator)
+    ]
+    required_operators = [
+        operation
+        for operation in required_operations
+        if isinstance(operation, Operator)
+    ]
+    all_monotonic = len(operators) == len(operations) and all(
+        operation.monotonic for operation in operators
+    )
+    apply_functions = get_apply_functions(operations)
+    required_apply_functions = get_apply_functions(required_operations)
     sum_total = 0
 
     for total, numbers in totals_and_numbers:
-        memo: dict[tuple[tuple[int, ...], int], bool] = {}
-        if try_find_successful_solution(total, numbers, memo, operations):
+        all_positive = min(numbers) > 0
+        if backward and all_positive:
+            solution = try_find_successful_solution_backward(
+                total, numbers, operators, required_operators
+            )
+        else:
+            solution = try_find_successful_solution(
+                total,
+                numbers,
+                apply_functions,
+                monotonic=all_monotonic and all_positive,
+                required_operations=required_apply_functions,
+            )
+
+        if solution is not None:
             sum_total += total
+        elif failed_equations is not None:
+            failed_equations.append((total, numbers))
 
     return sum_total
 
 
-def read_all_lines_from_file(file_path: str) -> list[str]:
-    """Read all the lines from the given file.
+# The operations, search direction and required operations shared with the
+# worker processes, set once per worker
+_worker_settings: tuple[
+    Sequence[Callable[[int, int], int]],
+    bool,
+    Sequence[Callable[[int, int], int]],
+]
+
+
+def _initialize_worker(
+    operations: Sequence[Callable[[int, int], int]],
+    backward: bool,  # noqa: FBT001
+    required_operations: Sequence[Callable[[int, int], int]],
+) -> None:
+    global _worker_settings  # noqa: PLW0603
+    _worker_settings = (operations, backward, required_operations)
+
+
+def _sum_valid_totals_in_worker(
+    totals_and_numbers: list[tuple[int, list[int]]],
+) -> int:
+    operations, backward, required_operations = _worker_settings
+    return _sum_valid_totals(
+        totals_and_numbers,
+        operations,
+        backward=backward,
+        required_operations=required_operations,
+    )
+
+
+def get_sum_total_batched(
+    totals_and_numbers: list[tuple[int, list[int]]],
+    operations: Sequence[Callable[[int, int], int]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Get the sum total for all valid solutions, evaluating batches with NumPy.
+
+    Instead of searching one equation at a time, the set of reachable running
+    results is kept for a whole batch of equations of the same length, as one
+    array of results with the equation each belongs to. Every number applies all
+    operations to the whole array at once, after which results above their total
+    and duplicates are dropped.
+
+    This needs NumPy and monotonic Operators that provide apply_to_arrays, and
+    all numbers must be positive. Equations that could overflow 64 bits, and
+    everything when these requirements are not met, are solved by get_sum_total.
 
     Args:
-        file_path (str): The file to read the lines from
+        totals_and_numbers (list[tuple[int, list[int]]]):
+            The list of totals and their possible solution numbers
+        operations (Sequence[Callable[[int, int], int]]): The allowed
+            operations, either Operators or any other function of two numbers
+        batch_size (int): The maximum number of equations evaluated together
 
     Returns:
-        list[str]: The read lines
+        int: The total for all valid solutions
     """
-    with Path(file_path).open() as file:
-        return [line.rstrip() for line in file]
+    if np is None or not all(
+        isinstance(operation, Operator)
+        and operation.monotonic
+        and operation.apply_to_arrays is not None
+        for operation in operations
+    ):
+        return get_sum_total(totals_and_numbers, operations)
+
+    apply_to_arrays = [operation.apply_to_arrays for operation in operations]
+
+    equations_per_length: dict[int, list[tuple[int, list[int]]]] = {}
+    remaining_equations: list[tuple[int, list[int]]] = []
+    for total, numbers in totals_and_numbers:
+        # Results above the total are dropped, so no operation on the remaining
+        # ones can get past the total times ten times the largest number
+        largest_number = max(numbers)
+        if (
+            min(numbers) <= 0
+            or total * 10 * largest_number + largest_number > INT64_MAX
+        ):
+            remaining_equations.append((total, numbers))
+        elif numbers[0] <= total:
+            # The first number is never dropped, but an equation starting above
+            # its total cannot be solved with monotonic operations anyway
+            equations_per_length.setdefault(len(numbers), []).append((total, numbers))
+
+    sum_total = 0
+    for equations in equations_per_length.values():
+        for batch in batched(equations, batch_size, strict=False):
+            sum_total += _sum_valid_totals_with_numpy(batch, apply_to_arrays)
+
+    return sum_total + get_sum_total(remaining_equations, operations)
+
+
+def _sum_valid_totals_with_numpy(
+    equations: tuple[tuple[int, list[int]], ...],
+    apply_to_arrays: list[ArrayOperation],
+) -> int:
+    # All equations have the same number of numbers
+    totals = np.array([total for total, _ in equations], dtype=np.int64)
+    numbers = np.array([numbers for _, numbers in equations], dtype=np.int64)
+
+    results = numbers[:, 0]
+    equation_indexes = np.arange(len(equations))
+    for column in range(1, numbers.shape[1]):
+        operands = numbers[equation_indexes, column]
+        results = np.concatenate(
+            [apply(results, operands) for apply in apply_to_arrays]
+        )
+        equation_indexes = np.tile(equation_indexes, len(apply_to_arrays))
+
+        within_total = results <= totals[equation_indexes]
+        results = results[within_total]
+        equation_indexes = equation_indexes[within_total]
+
+        # Different operations often reach the same result, keep it only once
+        order = np.lexsort((results, equation_indexes))
+        results = results[order]
+        equation_indexes = equation_indexes[order]
+        distinct = np.ones(len(results), dtype=np.bool_)
+        distinct[1:] = (results[1:] != results[:-1]) | (
+            equation_indexes[1:] != equation_indexes[:-1]
+        )
+        results = results[distinct]
+        equation_indexes = equation_indexes[distinct]
+
+    solved_indexes = np.unique(equation_indexes[results == totals[equation_indexes]])
+    return sum(equations[index][0] for index in solved_indexes.tolist())
 
 
 def parse_lines(lines: list[str]) -> list[tuple[int, list[int]]]:
@@ -100,30 +678,81 @@ def parse_lines(lines: list[str]) -> list[tuple[int, list[int]]]:
     Returns:
         list[tuple[int, list[int]]]: The totals and their numbers after parsing
     """
-    totals_and_numbers: list[tuple[int, list[int]]] = []
+    return get_totals_and_numbers_from_rows(parse_integer_lines(lines, ":"))
+
+
+def get_totals_and_numbers_from_rows(
+    rows: IntegerRows,
+) -> list[tuple[int, list[int]]]:
+    """Split parsed equation rows into their totals and numbers.
+
+    Args:
+        rows (IntegerRows): The parsed equations, the total first on every row
+
+    Returns:
+        list[tuple[int, list[int]]]: The totals and their numbers
+    """
+    return [(row[0], row[1:]) for row in rows if row]
 
-    for line in lines:
-        total_part, numbers_part = line.split(":")
-        total = int(total_part.strip())
-        numbers = list(map(int, numbers_part.strip().split()))
-        totals_and_numbers.append((total, numbers))
 
-    return totals_and_numbers
+@cached_parser(version=1)
+def read_equations_from_file(file_path: str) -> list[tuple[int, list[int]]]:
+    """Read the totals and their numbers from the given file.
 
+    Args:
+        file_path (str): The file to read the equations from
 
-def main() -> None:
-    """Main entry point for this application."""
-    lines = read_all_lines_from_file(
-        "/workspaces/advent-of-code/year2024/day07/input.txt"
-    )
+    Returns:
+        list[tuple[int, list[int]]]: The totals and their numbers
+    """
+    return get_totals_and_numbers_from_rows(read_integers_from_file(file_path, ":"))
 
-    totals_and_numbers = parse_lines(lines)
 
-    sum_total = get_sum_total(totals_and_numbers, OPERATIONS_PART1)
-    print(f"Solution Part 1: {sum_total}")
+def parse_input(file_path: str) -> list[tuple[int, list[int]]]:
+    """Parse the puzzle input for both parts.
 
-    sum_total = get_sum_total(totals_and_numbers, OPERATIONS_PART2)
-    print(f"Solution Part 2: {sum_total}")
+    Args:
+        file_path (str): The puzzle input file
+
+    Returns:
+        list[tuple[int, list[int]]]: The totals and their numbers
+    """
+    return read_equations_from_file(file_path)
+
+
+def solve_part1(totals_and_numbers: list[tuple[int, list[int]]]) -> int:
+    """Solve part 1 of the puzzle.
+
+    Args:
+        totals_and_numbers (list[tuple[int, list[int]]]): The totals and their numbers
+
+    Returns:
+        int: The solution for part 1
+    """
+    return get_sum_total(totals_and_numbers, OPERATIONS_PART1, backward=True)
+
+
+def solve_part2(totals_and_numbers: list[tuple[int, list[int]]]) -> int:
+    """Solve part 2 of the puzzle.
+
+    Args:
+        totals_and_numbers (list[tuple[int, list[int]]]): The totals and their numbers
+
+    Returns:
+        int: The solution for part 2
+    """
+    return get_sum_total(totals_and_numbers, OPERATIONS_PART2, backward=True)
+
+
+def main() -> None:
+    """Main entry point for this application."""
+    totals_and_numbers = read_equations_from_file("input.txt")
+
+    sum_total_part1, sum_total_part2 = get_sum_totals_incrementally(
+        totals_and_numbers, backward=True
+    )
+    print(f"Solution Part 1: {sum_total_part1}")
+    print(f"Solution Part 2: {sum_total_part2}")
 
 
 if __name__ == "__main__":
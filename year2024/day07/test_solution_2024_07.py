@@ -1,8 +1,23 @@
+import operator
+
+import pytest
+
 from year2024.day07.solution_2024_07 import (
+    ADD,
+    CONCATENATE,
+    MULTIPLY,
     OPERATIONS_PART1,
     OPERATIONS_PART2,
+    concatenate,
+    get_power_of_ten_above,
+    get_reachable_range,
     get_sum_total,
+    get_sum_total_batched,
+    get_sum_totals_incrementally,
     parse_lines,
+    split_into_balanced_chunks,
+    try_find_successful_solution,
+    try_find_successful_solution_backward,
 )
 
 
@@ -38,3 +53,202 @@ def test_puzzle_input_part2() -> None:
     ]
     test_input = parse_lines(test_input_lines)
     assert get_sum_total(test_input, OPERATIONS_PART2) == 11387  # noqa: PLR2004
+
+
+def test_puzzle_input_backward() -> None:
+    """Test example puzzle input for both parts, working back from the totals."""
+    test_input_lines = [
+        "190: 10 19",
+        "3267: 81 40 27",
+        "83: 17 5",
+        "156: 15 6",
+        "7290: 6 8 6 15",
+        "161011: 16 10 13",
+        "192: 17 8 14",
+        "21037: 9 7 18 13",
+        "292: 11 6 16 20",
+    ]
+    test_input = parse_lines(test_input_lines)
+    assert get_sum_total(test_input, OPERATIONS_PART1, backward=True) == 3749  # noqa: PLR2004
+    assert get_sum_total(test_input, OPERATIONS_PART2, backward=True) == 11387  # noqa: PLR2004
+
+
+def test_undo_operators() -> None:
+    """Test that the operators only undo to positive left operands."""
+    assert CONCATENATE.undo(15613, 13) == 156  # noqa: PLR2004
+    assert CONCATENATE.undo(15613, 3) == 1561  # noqa: PLR2004
+    assert CONCATENATE.undo(13, 13) is None
+    assert CONCATENATE.undo(15613, 12) is None
+    assert MULTIPLY.undo(3267, 27) == 121  # noqa: PLR2004
+    assert MULTIPLY.undo(3267, 26) is None
+    assert ADD.undo(190, 19) == 171  # noqa: PLR2004
+    assert ADD.undo(19, 19) is None
+
+
+def test_concatenate() -> None:
+    """Test concatenating numbers of all sizes with arithmetic."""
+    assert get_power_of_ten_above(0) == 10  # noqa: PLR2004
+    assert get_power_of_ten_above(9999) == 10_000  # noqa: PLR2004
+    assert get_power_of_ten_above(10_000) == 100_000  # noqa: PLR2004
+    assert get_power_of_ten_above(10**25) == 10**26
+    assert concatenate(12, 345) == 12345  # noqa: PLR2004
+    assert concatenate(7, 0) == 70  # noqa: PLR2004
+    assert concatenate(1, 10**19) == int(f"1{10**19}")
+
+
+def test_plain_callables() -> None:
+    """Test that the forward search takes plain functions as operations."""
+    test_input = parse_lines(["190: 10 19", "3267: 81 40 27", "156: 15 6"])
+    operations = [operator.add, operator.mul, concatenate]
+    assert get_sum_total(test_input, operations) == 3613  # noqa: PLR2004
+
+    with pytest.raises(ValueError, match="Operators"):
+        get_sum_total(test_input, operations, backward=True)
+
+
+def test_bounded_memo() -> None:
+    """Test that the forward search gives the same result for any memo size."""
+    operations = [operator.add, operator.mul, concatenate]
+    for memo_size in (None, 0, 2):
+        assert try_find_successful_solution(7290, [6, 8, 6, 15], operations, memo_size)
+        assert (
+            try_find_successful_solution(21037, [9, 7, 18, 13], operations, memo_size)
+            is None
+        )
+
+
+def test_puzzle_input_with_workers() -> None:
+    """Test example puzzle input for both parts, solved in worker processes."""
+    test_input_lines = [
+        "190: 10 19",
+        "3267: 81 40 27",
+        "83: 17 5",
+        "156: 15 6",
+        "7290: 6 8 6 15",
+        "161011: 16 10 13",
+        "192: 17 8 14",
+        "21037: 9 7 18 13",
+        "292: 11 6 16 20",
+    ]
+    test_input = parse_lines(test_input_lines)
+    assert get_sum_total(test_input, OPERATIONS_PART1, workers=2) == 3749  # noqa: PLR2004
+    assert (
+        get_sum_total(test_input, OPERATIONS_PART2, backward=True, workers=2) == 11387  # noqa: PLR2004
+    )
+
+
+def test_split_into_balanced_chunks() -> None:
+    """Test that long equations are spread over the chunks first."""
+    equations = [(1, [1] * length) for length in (2, 5, 3, 5, 2, 4)]
+    chunks = split_into_balanced_chunks(equations, 2, 2)
+    assert chunks == [
+        [(1, [1] * 5), (1, [1] * 4)],
+        [(1, [1] * 5), (1, [1] * 3), (1, [1] * 2), (1, [1] * 2)],
+    ]
+    assert split_into_balanced_chunks(equations[:1], 2, 4) == [[(1, [1, 1])]]
+
+
+def test_monotonic_pruning() -> None:
+    """Test the reachable range and that pruning keeps the same results."""
+    assert OPERATIONS_PART2[2].monotonic
+    assert get_reachable_range([81, 40, 27], [operator.add, operator.mul]) == (
+        148,
+        87480,
+    )
+    assert get_reachable_range([1, 1], [operator.add, operator.mul]) == (1, 2)
+
+    operations = [operator.add, operator.mul, concatenate]
+    for total, numbers in parse_lines(["7290: 6 8 6 15", "21037: 9 7 18 13"]):
+        assert try_find_successful_solution(
+            total, numbers, operations, monotonic=True
+        ) == try_find_successful_solution(total, numbers, operations)
+
+
+def test_puzzle_input_incrementally() -> None:
+    """Test example puzzle input for both parts, reusing the part 1 results."""
+    test_input_lines = [
+        "190: 10 19",
+        "3267: 81 40 27",
+        "83: 17 5",
+        "156: 15 6",
+        "7290: 6 8 6 15",
+        "161011: 16 10 13",
+        "192: 17 8 14",
+        "21037: 9 7 18 13",
+        "292: 11 6 16 20",
+    ]
+    test_input = parse_lines(test_input_lines)
+    for backward in (False, True):
+        assert get_sum_totals_incrementally(test_input, backward=backward) == (
+            3749,
+            11387,
+        )
+
+
+def test_required_operations() -> None:
+    """Test that only solutions using a required operation are counted."""
+    operations = [operator.add, operator.mul, concatenate]
+    assert try_find_successful_solution(190, [10, 19], operations) == 190  # noqa: PLR2004
+    assert (
+        try_find_successful_solution(
+            190, [10, 19], operations, required_operations=[concatenate]
+        )
+        is None
+    )
+    assert (
+        try_find_successful_solution(
+            1019, [10, 19], operations, required_operations=[concatenate]
+        )
+        == 1019  # noqa: PLR2004
+    )
+    assert (
+        try_find_successful_solution_backward(
+            190, [10, 19], OPERATIONS_PART2, [CONCATENATE]
+        )
+        is None
+    )
+
+
+def test_puzzle_input_batched() -> None:
+    """Test example puzzle input for both parts, evaluated in batches with NumPy."""
+    pytest.importorskip("numpy")
+
+    test_input_lines = [
+        "190: 10 19",
+        "3267: 81 40 27",
+        "83: 17 5",
+        "156: 15 6",
+        "7290: 6 8 6 15",
+        "161011: 16 10 13",
+        "192: 17 8 14",
+        "21037: 9 7 18 13",
+        "292: 11 6 16 20",
+    ]
+    test_input = parse_lines(test_input_lines)
+    assert get_sum_total_batched(test_input, OPERATIONS_PART1, batch_size=2) == 3749  # noqa: PLR2004
+    assert get_sum_total_batched(test_input, OPERATIONS_PART2, batch_size=2) == 11387  # noqa: PLR2004
+
+    # Too large for 64 bits, so solved with Python integers instead
+    large_total = 10**18 * 10**6 + 123456
+    assert get_sum_total_batched(
+        [(large_total, [10**18, 123456])], OPERATIONS_PART2
+    ) == (large_total)
+
+    # A first number above the total would overflow 64 bits in the first step,
+    # here to 2**64 + 1, which wraps around to the total
+    assert get_sum_total_batched([(1, [274177, 67280421310721])], OPERATIONS_PART1) == 0
+    assert get_sum_total_batched([(1, [1844674407, 3709551617])], OPERATIONS_PART2) == 0
+
+
+def test_puzzle_input_batched_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the fallback to the search when NumPy is not installed."""
+    monkeypatch.setattr("year2024.day07.solution_2024_07.np", None)
+
+    test_input = parse_lines(["190: 10 19", "156: 15 6", "83: 17 5"])
+    assert get_sum_total_batched(test_input, OPERATIONS_PART2) == 346  # noqa: PLR2004
+
+
+def test_puzzle_input_batched_with_plain_functions() -> None:
+    """Test the fallback to the search for operations that are not Operators."""
+    test_input = parse_lines(["190: 10 19", "156: 15 6", "83: 17 5"])
+    assert get_sum_total_batched(test_input, [operator.add, operator.mul]) == 190  # noqa: PLR2004